@@ -0,0 +1,44 @@
+import random
+import sys
+import time
+
+from count_products import count_products
+from count_sales import count_sales
+from stream_counter import CountMinSketch, count_parallel, count_stream, sketch_parallel
+
+# Compara count_products / count_sales con el conteo por bloques, el paralelo
+# y el Count-Min Sketch sobre el mismo flujo de pedidos.
+# Las versiones paralelas mandan cada bloque a otro proceso: con los pedidos ya en
+# memoria solo compensan con varios núcleos, y con un solo núcleo son más lentas.
+
+
+def measure(name, func, orders):
+    start = time.perf_counter()
+    result = func(orders)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16} {elapsed:8.3f}s  {len(orders) / elapsed:>14,.0f} pedidos/s")
+    return result
+
+
+def sketch(orders):
+    cms = CountMinSketch(k=5)
+    cms.update(orders)
+    return cms
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    # Distribución sesgada: pocos productos muy vendidos y muchos poco vendidos
+    products = [f"product_{i}" for i in range(100_000)]
+    weights = [1 / (i + 1) for i in range(len(products))]
+    orders = random.choices(products, weights=weights, k=size)
+
+    exact = measure('count_products', count_products, orders)
+    measure('count_sales', count_sales, orders)
+    measure('count_stream', count_stream, orders)
+    measure('count_parallel', count_parallel, orders)
+    cms = measure('count-min sketch', sketch, orders)
+    measure('sketch_parallel', sketch_parallel, orders)
+
+    print("\nTop 5 exacto:     ", sorted(exact.items(), key=lambda item: item[1], reverse=True)[:5])
+    print("Top 5 aproximado: ", cms.most_common(5))
@@ -7,6 +7,7 @@ def count_products(orders: list[str]) -> defaultdict:
         product_count[product] +=1
     return product_count
 
-orders = ['laptop', 'smartphone', 'laptop', 'tablet']
-count = count_products(orders)
-print(count)
+if __name__ == "__main__":
+    orders = ['laptop', 'smartphone', 'laptop', 'tablet']
+    count = count_products(orders)
+    print(count)
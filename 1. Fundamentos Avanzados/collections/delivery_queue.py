@@ -0,0 +1,308 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from collections import deque
+
+# Cola de entregas persistente basada en manage_delivery_queue:
+# - cada carril de prioridad es un deque en memoria respaldado por segmentos en disco
+# - los pedidos se agregan al final del segmento actual (append-only, JSON por línea)
+# - un archivo "head" guarda cuántos pedidos del primer segmento ya se entregaron
+# - al reiniciar, se recargan los pedidos pendientes desde los segmentos
+# Si el proceso se corta entre un get y la escritura del head, ese pedido se
+# vuelve a entregar (al menos una vez). Si se corta en medio de un put, la línea
+# incompleta al final del segmento se descarta al reiniciar.
+
+LANES = ('high', 'normal', 'low')  # Orden de prioridad
+
+
+class _Lane:
+    def __init__(self, directory, name, segment_size, fsync):
+        self.directory = directory
+        self.name = name
+        self.segment_size = segment_size  # Pedidos por segmento
+        self.fsync = fsync
+        self.pending = deque()
+        self.segments = deque()  # [número de segmento, cantidad de pedidos]
+        self.head = 0  # Pedidos ya entregados del primer segmento
+        self.writer = None
+        self._load()
+
+    def _path(self, number):
+        return os.path.join(self.directory, f"{self.name}-{number:08d}.log")
+
+    def _head_path(self):
+        return os.path.join(self.directory, f"{self.name}.head")
+
+    def _load(self):
+        prefix = f"{self.name}-"
+        numbers = sorted(
+            int(file[len(prefix):-4]) for file in os.listdir(self.directory)
+            if file.startswith(prefix) and file.endswith('.log')
+        )
+        if os.path.exists(self._head_path()):
+            with open(self._head_path(), mode='r') as file:
+                first, self.head = map(int, file.read().split())
+            # Segmentos anteriores al head ya fueron entregados
+            for number in numbers:
+                if number < first:
+                    os.remove(self._path(number))
+            numbers = [number for number in numbers if number >= first]
+            if not numbers or numbers[0] != first:
+                self.head = 0
+
+        for position, number in enumerate(numbers):
+            orders = self._read_segment(self._path(number))
+            self.segments.append([number, len(orders)])
+            self.pending.extend(orders[self.head:] if position == 0 else orders)
+
+        if not self.segments:
+            self.segments.append([0, 0])
+        self.writer = open(self._path(self.segments[-1][0]), mode='a', encoding='utf-8')
+
+    def _read_segment(self, path):
+        orders = []
+        end = 0  # Fin de la última línea completa
+        with open(path, mode='r+b') as file:
+            for line in file:
+                if not line.endswith(b'\n'):
+                    # Escritura cortada: se borra para que el próximo put no quede pegado a ella
+                    file.truncate(end)
+                    break
+                end += len(line)
+                if line.strip():
+                    orders.append(json.loads(line))
+        return orders
+
+    def put_many(self, orders):
+        for order in orders:
+            if self.segments[-1][1] >= self.segment_size:
+                self._rotate()
+            self.writer.write(json.dumps(order) + '\n')
+            self.segments[-1][1] += 1
+            self.pending.append(order)
+        self.writer.flush()
+        if self.fsync:
+            os.fsync(self.writer.fileno())
+
+    def _rotate(self):
+        self.writer.close()
+        number = self.segments[-1][0] + 1
+        self.segments.append([number, 0])
+        self.writer = open(self._path(number), mode='a', encoding='utf-8')
+
+    def get_many(self, max_items):
+        orders = []
+        while self.pending and len(orders) < max_items:
+            orders.append(self.pending.popleft())
+        if not orders:
+            return orders
+
+        self.head += len(orders)
+        # Borrar los segmentos que ya se entregaron por completo (menos el actual)
+        while len(self.segments) > 1 and self.head >= self.segments[0][1]:
+            number, count = self.segments.popleft()
+            self.head -= count
+            os.remove(self._path(number))
+        self._save_head()
+        return orders
+
+    def _save_head(self):
+        tmp_path = self._head_path() + '.tmp'
+        with open(tmp_path, mode='w') as file:
+            file.write(f"{self.segments[0][0]} {self.head}")
+            if self.fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        os.replace(tmp_path, self._head_path())
+
+    def close(self):
+        self.writer.close()
+
+
+class DeliveryQueue:
+    def __init__(self, directory='delivery_queue', lanes=LANES, segment_size=10_000, fsync=False):
+        os.makedirs(directory, exist_ok=True)
+        self.lanes = {name: _Lane(directory, name, segment_size, fsync) for name in lanes}
+        self.order = list(lanes)
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.async_waiters = set()  # (loop, asyncio.Event) de los aget_many esperando
+        # Lock propio del set: el event loop lo toma sin esperar escrituras a disco de self.lock
+        self.waiters_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        with self.lock:
+            return sum(len(lane.pending) for lane in self.lanes.values())
+
+    def put(self, order, lane='normal'):
+        self.put_many([order], lane)
+
+    def put_many(self, orders, lane='normal'):
+        """Agrega varios pedidos con una sola escritura a disco"""
+        with self.not_empty:
+            self.lanes[lane].put_many(orders)
+            self._notify()
+
+    def _notify(self):
+        # Con el lock tomado
+        self.not_empty.notify_all()
+        # Los consumidores async esperan un asyncio.Event: se despiertan desde su propio loop
+        with self.waiters_lock:
+            waiters = list(self.async_waiters)
+        for loop, event in waiters:
+            loop.call_soon_threadsafe(event.set)
+
+    def _take(self, max_items):
+        """Con el lock tomado: saca hasta max_items pedidos sin esperar, como [(carril, pedidos)]"""
+        taken = []
+        count = 0
+        for name in self.order:
+            orders = self.lanes[name].get_many(max_items - count)
+            if orders:
+                taken.append((name, orders))
+                count += len(orders)
+            if count >= max_items:
+                break
+        return taken
+
+    def _try_take(self, max_items):
+        with self.lock:
+            return self._take(max_items)
+
+    def _requeue(self, taken):
+        """Vuelve a encolar pedidos ya sacados (al final de su carril) porque nadie los recibió"""
+        with self.not_empty:
+            for name, orders in taken:
+                self.lanes[name].put_many(orders)
+            self._notify()
+
+    def get_many(self, max_items=100, timeout=None):
+        """
+        Entrega hasta max_items pedidos, primero de los carriles de mayor prioridad.
+        Espera hasta timeout segundos si la cola está vacía (None = sin límite).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_empty:
+            while True:
+                taken = self._take(max_items)
+                if taken:
+                    return [order for _, orders in taken for order in orders]
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return []
+                self.not_empty.wait(remaining)
+
+    def get(self, timeout=None):
+        """Entrega un pedido o None si se cumple el timeout"""
+        orders = self.get_many(1, timeout)
+        return orders[0] if orders else None
+
+    async def aput_many(self, orders, lane='normal'):
+        await asyncio.to_thread(self.put_many, orders, lane)
+
+    async def aget_many(self, max_items=100, timeout=None):
+        """
+        Versión async de get_many.
+
+        No usa un hilo para esperar: entre intentos la tarea espera un asyncio.Event
+        que put_many activa. Cada intento (lock, escritura y fsync del head) corre en
+        un hilo para no bloquear el event loop. Si la tarea se cancela durante un
+        intento, los pedidos que ese intento haya sacado se vuelven a encolar al final
+        de su carril: nunca quedan marcados como entregados sin que nadie los reciba.
+        """
+        loop = asyncio.get_running_loop()
+        event = asyncio.Event()
+        waiter = (loop, event)
+        deadline = None if timeout is None else loop.time() + timeout
+        with self.waiters_lock:
+            self.async_waiters.add(waiter)
+        try:
+            while True:
+                # clear() antes de mirar la cola: un put que llegue después despierta el wait
+                event.clear()
+                attempt = asyncio.ensure_future(asyncio.to_thread(self._try_take, max_items))
+                try:
+                    taken = await asyncio.shield(attempt)
+                except asyncio.CancelledError:
+                    attempt.add_done_callback(self._requeue_abandoned)
+                    raise
+                if taken:
+                    return [order for _, orders in taken for order in orders]
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    return []
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass  # Un último intento en la próxima vuelta y después se devuelve []
+        finally:
+            with self.waiters_lock:
+                self.async_waiters.discard(waiter)
+
+    def _requeue_abandoned(self, attempt):
+        # Callback de un intento de aget_many cuya tarea se canceló mientras corría
+        if attempt.cancelled() or attempt.exception() is not None or not attempt.result():
+            return
+        asyncio.get_running_loop().run_in_executor(None, self._requeue, attempt.result())
+
+    async def aget(self, timeout=None):
+        orders = await self.aget_many(1, timeout)
+        return orders[0] if orders else None
+
+    def close(self):
+        with self.lock:
+            for lane in self.lanes.values():
+                lane.close()
+
+
+if __name__ == "__main__":
+    import shutil
+    import sys
+    import tempfile
+
+    # Benchmark productor/consumidor: ops/s y latencia de punta a punta
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    directory = tempfile.mkdtemp()
+    latencies = []
+
+    with DeliveryQueue(directory) as queue:
+        def producer():
+            for start in range(0, total, batch):
+                now = time.perf_counter()
+                lane = LANES[start // batch % len(LANES)]
+                queue.put_many([[f"order_{i}", now] for i in range(start, min(start + batch, total))], lane)
+
+        def consumer():
+            received = 0
+            while received < total:
+                orders = queue.get_many(batch, timeout=5)
+                now = time.perf_counter()
+                latencies.extend(now - sent for _, sent in orders)
+                received += len(orders)
+                if not orders:
+                    break
+
+        start = time.perf_counter()
+        threads = [threading.Thread(target=producer), threading.Thread(target=consumer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f"{len(latencies):,} pedidos en {elapsed:.2f}s: {2 * len(latencies) / elapsed:,.0f} ops/s (put + get)")
+    print(f"latencia p50={percentile(0.5):.2f} ms p99={percentile(0.99):.2f} ms p99.9={percentile(0.999):.2f} ms")
+    shutil.rmtree(directory)
@@ -13,5 +13,7 @@ def check_order_status(status: OrderStatus):
         return "Order has been shipped."
     elif status == OrderStatus.DELIVERED:
         return "Order has been delivered."
-    
-print(check_order_status(OrderStatus.DELIVERED)) 
\ No newline at end of file
+
+
+if __name__ == "__main__":
+    print(check_order_status(OrderStatus.DELIVERED))
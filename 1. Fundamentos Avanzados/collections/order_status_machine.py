@@ -0,0 +1,140 @@
+import time
+
+from orderStatus import OrderStatus, check_order_status
+
+# Máquina de estados de pedidos:
+# - despacho por tabla (dict/lista) en lugar de la cadena if/elif
+# - transiciones válidas: PENDING -> SHIPPED -> DELIVERED
+# - columnas de estados guardadas como bytearray (1 byte por pedido) y
+#   transiciones masivas con bytes.translate, que recorre el array en C
+
+INVALID = 0  # Código reservado para marcar transiciones inválidas
+
+STATUS_MESSAGES = {
+    OrderStatus.PENDING: "Order is still pending.",
+    OrderStatus.SHIPPED: "Order has been shipped.",
+    OrderStatus.DELIVERED: "Order has been delivered.",
+}
+
+TRANSITIONS = {
+    OrderStatus.PENDING: {OrderStatus.SHIPPED},
+    OrderStatus.SHIPPED: {OrderStatus.DELIVERED},
+    OrderStatus.DELIVERED: set(),
+}
+
+# Mensajes indexados por código: MESSAGES_BY_CODE[status.value]
+MESSAGES_BY_CODE = [None] * (max(status.value for status in OrderStatus) + 1)
+for _status, _message in STATUS_MESSAGES.items():
+    MESSAGES_BY_CODE[_status.value] = _message
+
+HANDLERS = {}
+
+
+def on_status(status: OrderStatus):
+    """Registra una función a llamar cuando un pedido entra en `status`"""
+    def decorator(func):
+        HANDLERS.setdefault(status, []).append(func)
+        return func
+    return decorator
+
+
+def status_message(status: OrderStatus) -> str:
+    # Una búsqueda en el dict, sin importar cuántos estados haya
+    return STATUS_MESSAGES[status]
+
+
+def transition(order_id, current: OrderStatus, target: OrderStatus) -> OrderStatus:
+    """Valida y aplica una transición individual, llamando a los handlers registrados"""
+    if target not in TRANSITIONS[current]:
+        raise ValueError(f"Invalid transition {current.name} -> {target.name}")
+    for handler in HANDLERS.get(target, ()):
+        handler(order_id, current, target)
+    return target
+
+
+def encode(statuses) -> bytearray:
+    """Convierte una lista de OrderStatus en una columna compacta (1 byte por pedido)"""
+    return bytearray(status.value for status in statuses)
+
+
+def _transition_tables(target: OrderStatus):
+    # Tabla estricta: los códigos que no pueden pasar a target se marcan INVALID.
+    # Tabla permisiva: esos códigos quedan como estaban.
+    strict = bytearray([INVALID]) * 256
+    lenient = bytearray(range(256))
+    for status, targets in TRANSITIONS.items():
+        if target in targets:
+            strict[status.value] = lenient[status.value] = target.value
+    return bytes(strict), bytes(lenient)
+
+
+TABLES = {status: _transition_tables(status) for status in OrderStatus}
+
+
+def bulk_transition(statuses: bytearray, target: OrderStatus, strict=True) -> int:
+    """
+    Pasa a `target` todos los pedidos de la columna que puedan hacerlo.
+
+    Si hay handlers registrados para `target` (on_status), se llaman por cada pedido
+    movido con su posición en la columna como order_id, después de actualizarla.
+    Sin handlers no se recorre la columna en Python.
+
+    Parámetros:
+    statuses (bytearray): Columna de códigos de estado (se modifica en el lugar)
+    target (OrderStatus): Estado destino
+    strict (bool): Si es True y algún pedido no puede pasar a target, no se cambia nada
+
+    Retorna:
+    int: Cantidad de pedidos que cambiaron de estado
+    """
+    strict_table, lenient_table = TABLES[target]
+    moved = statuses.translate(strict_table)
+    invalid = moved.count(INVALID)
+    if strict and invalid:
+        raise ValueError(f"{invalid} orders cannot transition to {target.name}")
+    if invalid:
+        moved = statuses.translate(lenient_table)
+    changed = len(statuses) - invalid
+    handlers = HANDLERS.get(target)
+    previous = bytes(statuses) if handlers and changed else None
+    statuses[:] = moved
+    if previous is not None:
+        for order_id, (old, new) in enumerate(zip(previous, moved)):
+            if old != new:
+                current = OrderStatus(old)
+                for handler in handlers:
+                    handler(order_id, current, target)
+    return changed
+
+
+def status_counts(statuses: bytearray) -> dict:
+    return {status: statuses.count(status.value) for status in OrderStatus}
+
+
+def bulk_messages(statuses: bytearray) -> list:
+    return [MESSAGES_BY_CODE[code] for code in statuses]
+
+
+if __name__ == "__main__":
+    import random
+
+    size = 1_000_000
+    orders = random.choices(list(OrderStatus), k=size)
+
+    def measure(name, func):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        print(f"{name:<32} {elapsed:8.3f}s  {size / elapsed:>14,.0f} pedidos/s")
+
+    measure('check_order_status (if/elif)', lambda: [check_order_status(status) for status in orders])
+    measure('status_message (dict)', lambda: [status_message(status) for status in orders])
+
+    column = encode(orders)
+    measure('bulk_messages (lista por código)', lambda: bulk_messages(column))
+
+    pending = bytearray([OrderStatus.PENDING.value]) * size
+    measure('bulk_transition PENDING->SHIPPED', lambda: bulk_transition(pending, OrderStatus.SHIPPED))
+    measure('bulk_transition mixto (permisivo)', lambda: bulk_transition(column, OrderStatus.DELIVERED, strict=False))
+    print({status.name: count for status, count in status_counts(column).items()})
+    print(f"Memoria: lista de Enum {size * 8 / 1e6:.0f} MB en punteros vs columna {len(column) / 1e6:.0f} MB")
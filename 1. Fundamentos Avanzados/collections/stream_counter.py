@@ -0,0 +1,201 @@
+import hashlib
+import heapq
+import json
+import multiprocessing
+import operator
+import struct
+import time
+from array import array
+from collections import Counter, deque
+from functools import partial
+from itertools import islice
+
+
+def chunks(iterable, size):
+    # Parte un iterador (posiblemente infinito) en listas de `size` elementos
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def read_orders(path, field='product'):
+    """
+    Lee pedidos de un archivo JSONL.
+
+    Cada línea puede ser un string ("laptop") o un objeto con el producto
+    en `field` ({"product": "laptop", ...}).
+    """
+    with open(path, mode='r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                order = json.loads(line)
+                yield order[field] if isinstance(order, dict) else order
+
+
+def count_stream(orders, chunk_size=100_000) -> Counter:
+    # Counter.update sobre listas usa el contador en C: sin `+= 1` en Python
+    total = Counter()
+    for chunk in chunks(orders, chunk_size):
+        total.update(chunk)
+    return total
+
+
+def count_parallel(orders, workers=None, chunk_size=100_000) -> Counter:
+    """Cuenta cada bloque en un proceso distinto y combina los Counter parciales"""
+    total = Counter()
+    with multiprocessing.Pool(workers) as pool:
+        for chunk_counts in pool.imap_unordered(Counter, chunks(orders, chunk_size)):
+            total.update(chunk_counts)
+    return total
+
+
+class SlidingWindowCounter:
+    """
+    Conteo de los últimos `window` segundos.
+
+    Los eventos se agrupan en buckets de `bucket` segundos; cuando un bucket
+    sale de la ventana se resta del total, así cada consulta es O(productos).
+    Un evento que llega tarde va al bucket de su timestamp (y vence con él);
+    si ese bucket ya salió de la ventana el evento se descarta.
+    """
+
+    def __init__(self, window=60.0, bucket=1.0):
+        self.window = window
+        self.bucket = bucket
+        self.buckets = deque()  # (inicio del bucket, Counter) ordenados por inicio
+        self.total = Counter()
+        self.latest = float('-inf')  # Timestamp más nuevo visto
+
+    def add(self, product, count=1, timestamp=None):
+        timestamp = time.time() if timestamp is None else timestamp
+        start = timestamp - timestamp % self.bucket
+        self.latest = max(self.latest, timestamp)
+        if start + self.bucket <= self.latest - self.window:
+            return  # Llegó tarde: su bucket ya venció
+        self._bucket_for(start)[product] += count
+        self.total[product] += count
+        self.expire(self.latest)
+
+    def _bucket_for(self, start):
+        if not self.buckets or self.buckets[-1][0] < start:
+            self.buckets.append((start, Counter()))
+            return self.buckets[-1][1]
+        # Fuera de orden: se busca desde el final, los atrasos suelen ser de pocos buckets
+        for i in range(len(self.buckets) - 1, -1, -1):
+            bucket_start, counter = self.buckets[i]
+            if bucket_start == start:
+                return counter
+            if bucket_start < start:
+                self.buckets.insert(i + 1, (start, Counter()))
+                return self.buckets[i + 1][1]
+        self.buckets.appendleft((start, Counter()))
+        return self.buckets[0][1]
+
+    def update(self, products, timestamp=None):
+        timestamp = time.time() if timestamp is None else timestamp
+        for product in products:
+            self.add(product, timestamp=timestamp)
+
+    def expire(self, now=None):
+        now = time.time() if now is None else now
+        while self.buckets and self.buckets[0][0] + self.bucket <= now - self.window:
+            _, old = self.buckets.popleft()
+            self.total.subtract(old)
+            # subtract deja claves en 0: se eliminan para no crecer sin límite
+            for product in old:
+                if self.total[product] <= 0:
+                    del self.total[product]
+
+    def most_common(self, k=None, now=None):
+        self.expire(now)
+        return self.total.most_common(k)
+
+
+class CountMinSketch:
+    """
+    Conteo aproximado con memoria fija (width * depth contadores).
+
+    Nunca subestima: el error es como máximo ~ 2 * total / width con
+    probabilidad 1 - (1/2) ** depth. Además guarda los k productos más
+    frecuentes vistos (top-k).
+    """
+
+    def __init__(self, width=2 ** 16, depth=4, k=10):
+        if depth > 16:
+            raise ValueError('depth must be at most 16')
+        self.width = width
+        self.depth = depth
+        self.k = k
+        self.table = [array('Q', bytes(8 * width)) for _ in range(depth)]
+        self.top = {}  # producto -> estimación
+        self.hash_format = f'<{depth}I'  # depth enteros de 4 bytes del digest
+
+    def _indexes(self, product):
+        # Un solo hash por producto; blake2b es igual en todos los procesos (hash() no)
+        digest = hashlib.blake2b(str(product).encode('utf-8'), digest_size=4 * self.depth).digest()
+        return [value % self.width for value in struct.unpack(self.hash_format, digest)]
+
+    def _add_counts(self, product, count):
+        for row, index in zip(self.table, self._indexes(product)):
+            row[index] += count
+
+    def add(self, product, count=1):
+        self._add_counts(product, count)
+        self._track(product, self.estimate(product))
+
+    def update(self, products):
+        # Se agrupa primero con Counter: un hash por producto distinto del bloque
+        counts = Counter(products)
+        for product, count in counts.items():
+            self._add_counts(product, count)
+        # Solo los más vendidos del bloque pueden entrar al top-k: el resto no se estima
+        for product in heapq.nlargest(self.k, counts, key=counts.get):
+            self._track(product, self.estimate(product))
+
+    def estimate(self, product):
+        return min(row[index] for row, index in zip(self.table, self._indexes(product)))
+
+    def _track(self, product, estimate):
+        if product in self.top or len(self.top) < self.k:
+            self.top[product] = estimate
+            return
+        smallest = min(self.top, key=self.top.get)
+        if estimate > self.top[smallest]:
+            del self.top[smallest]
+            self.top[product] = estimate
+
+    def merge(self, other):
+        """Suma otro sketch con las mismas dimensiones (por ejemplo, de otro proceso)"""
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('sketches must have the same width and depth')
+        # map(operator.add) suma las filas en C: un bucle en Python sobre width * depth
+        # contadores costaba más que contar el bloque
+        for i, (row, other_row) in enumerate(zip(self.table, other.table)):
+            self.table[i] = array('Q', map(operator.add, row, other_row))
+        candidates = set(self.top) | set(other.top)
+        self.top = {}
+        for product in candidates:
+            self._track(product, self.estimate(product))
+
+    def most_common(self, k=None):
+        return sorted(self.top.items(), key=lambda item: item[1], reverse=True)[:k or self.k]
+
+
+def sketch_chunk(chunk, width=2 ** 16, depth=4, k=10):
+    sketch = CountMinSketch(width, depth, k)
+    sketch.update(chunk)
+    return sketch
+
+
+def sketch_parallel(orders, workers=None, chunk_size=100_000, width=2 ** 16, depth=4, k=10):
+    """Un sketch por bloque en cada proceso, combinados a medida que llegan"""
+    total = CountMinSketch(width, depth, k)
+    with multiprocessing.Pool(workers) as pool:
+        # imap_unordered consume los bloques de a poco (starmap haría list() de todo el stream)
+        sketch = partial(sketch_chunk, width=width, depth=depth, k=k)
+        for partial_sketch in pool.imap_unordered(sketch, chunks(orders, chunk_size)):
+            total.merge(partial_sketch)
+    return total
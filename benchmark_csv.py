@@ -0,0 +1,63 @@
+"""
+Benchmark: csv_engine (Python puro) vs csv_columnar (NumPy)
+
+Genera versiones sintéticas de products.csv con 1M y 10M de filas en un
+directorio temporal y mide ambos caminos.
+
+Uso: python benchmark_csv.py [filas ...]
+"""
+
+import csv
+import os
+import random
+import sys
+import tempfile
+
+from csv_engine import transform_csv
+from csv_columnar import transform_csv_columnar
+
+COLUMNS = ['name', 'price', 'quantity']
+
+
+def generate_products(path, rows):
+    """Escribe un products.csv sintético con la misma cabecera que el original"""
+    brands = ['BrandName', 'TechGear', 'KeyMasters', 'ViewSharp', 'SoundMax']
+    categories = ['Electronics', 'Accessories', 'Audio']
+    with open(path, mode='w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['name', 'price', 'quantity', 'brand', 'category', 'entry_date'])
+        batch = []
+        for i in range(rows):
+            batch.append((
+                f"Product {i}",
+                random.randint(1, 2000),
+                random.randint(1, 500),
+                random.choice(brands),
+                random.choice(categories),
+                f"2024-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
+            ))
+            if len(batch) == 10_000:
+                writer.writerows(batch)
+                batch.clear()
+        writer.writerows(batch)
+
+
+def main(sizes):
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in sizes:
+            source = os.path.join(tmp, f"products_{rows}.csv")
+            print(f"\nGenerando {rows:,} filas...")
+            generate_products(source, rows)
+
+            python_stats = transform_csv(source, os.path.join(tmp, 'python.csv'), COLUMNS)
+            columnar_stats = transform_csv_columnar(source, os.path.join(tmp, 'columnar.csv'), COLUMNS)
+
+            print(f"python:   {python_stats['seconds']:.2f}s ({python_stats['rows_per_sec']:,.0f} filas/s)")
+            print(f"{columnar_stats['backend']:<9} {columnar_stats['seconds']:.2f}s "
+                  f"({columnar_stats['rows_per_sec']:,.0f} filas/s)")
+            print(f"speedup:  {python_stats['seconds'] / columnar_stats['seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000_000, 10_000_000]
+    main(sizes)
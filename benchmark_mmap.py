@@ -0,0 +1,65 @@
+"""
+Benchmark: lectura con open()/DictReader vs mmap_reader
+
+Para medir lectura desde disco el archivo debe ser más grande que la memoria
+libre del page cache (o vaciar el cache antes de cada corrida con
+`sync; echo 3 > /proc/sys/vm/drop_caches`, requiere root).
+
+Uso: python benchmark_mmap.py [filas] [ruta]
+"""
+
+import csv
+import os
+import sys
+import time
+
+from benchmark_csv import generate_products
+from mmap_reader import MappedFile, iter_csv, parallel_count
+
+
+def measure(name, func, path):
+    start = time.perf_counter()
+    total = func(path)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<24} resultado={total:<16,} {elapsed:8.2f}s")
+
+
+def dictreader_total(path):
+    total = 0.0
+    with open(path, mode='r') as file:
+        for row in csv.DictReader(file):
+            total += float(row['price']) * float(row['quantity'])
+    return int(total)
+
+
+def mmap_csv_total(path):
+    total = 0.0
+    rows = iter_csv(path)
+    next(rows)  # cabecera
+    for row in rows:
+        total += float(row[1]) * float(row[2])
+    return int(total)
+
+
+def mmap_records(path):
+    # Solo recorre los registros sin copiarlos
+    with MappedFile(path) as mapped:
+        return sum(1 for _ in mapped.records())
+
+
+def main(rows, path):
+    if not os.path.exists(path):
+        print(f"Generando {rows:,} filas en {path}...")
+        generate_products(path, rows)
+    print(f"Tamaño: {os.path.getsize(path) / 1e9:.2f} GB")
+
+    measure('open()/DictReader', dictreader_total, path)
+    measure('mmap + csv.reader', mmap_csv_total, path)
+    measure('mmap registros', mmap_records, path)
+    measure('mmap paralelo (conteo)', parallel_count, path)
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000_000
+    path = sys.argv[2] if len(sys.argv) > 2 else 'products_big.csv'
+    main(rows, path)
@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# En lugar de crear un hilo del SO por tarea (como threadingTasks en practice.py),
+# un número fijo de hilos va tomando tareas de una cola acotada.
+# Si la cola está llena, submit() bloquea al productor (backpressure).
+
+
+class BoundedExecutor:
+    def __init__(self, max_workers=None, queue_size=None):
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        self.queue_size = self.max_workers * 2 if queue_size is None else queue_size
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # Cupos = tareas ejecutándose + tareas esperando en la cola
+        self.slots = threading.BoundedSemaphore(self.max_workers + self.queue_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown()
+
+    def submit(self, fn, *args, **kwargs):
+        """Encola una tarea; bloquea mientras la cola esté llena"""
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+    def map(self, fn, iterable):
+        """Ejecuta fn sobre cada elemento y devuelve los resultados en orden"""
+        futures = [self.submit(fn, item) for item in iterable]
+        return [future.result() for future in futures]
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+def task(args, seconds=0.01):
+    time.sleep(seconds)
+    return args
+
+
+def run_unbounded(tasks):
+    # El patrón original: un threading.Thread por tarea, todos a la vez
+    threads = []
+    for i in range(tasks):
+        thread = threading.Thread(target=task, args=(i,))
+        threads.append(thread)
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def run_bounded(tasks, max_workers=64):
+    with BoundedExecutor(max_workers=max_workers) as executor:
+        executor.map(task, range(tasks))
+
+
+def peak_rss_mb():
+    """RSS máximo de este proceso en MB, o None donde no hay módulo resource (Windows)"""
+    try:
+        import resource  # Solo existe en Unix
+    except ImportError:
+        return None
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak_rss //= 1024
+    return peak_rss / 1024
+
+
+def measure(mode, tasks):
+    """Corre un escenario y muestra tiempo total y RSS máximo (en este proceso)"""
+    start = time.perf_counter()
+    try:
+        run_bounded(tasks) if mode == 'bounded' else run_unbounded(tasks)
+        status = 'ok'
+    except RuntimeError as error:  # "can't start new thread"
+        status = f"error: {error}"
+    elapsed = time.perf_counter() - start
+    peak_rss = peak_rss_mb()
+    rss = f"{peak_rss:8.1f} MB" if peak_rss is not None else f"{'n/d':>8}   "
+    print(f"{mode:<10} tareas={tasks:<6} {elapsed:8.2f}s  RSS máx={rss}  {status}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        measure(sys.argv[1], int(sys.argv[2]))
+    else:
+        # Cada escenario en su propio proceso: el RSS máximo no se mezcla entre corridas
+        for tasks in (300, 3_000, 30_000):
+            for mode in ('unbounded', 'bounded'):
+                subprocess.run([sys.executable, __file__, mode, str(tasks)])
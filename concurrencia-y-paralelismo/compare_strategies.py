@@ -0,0 +1,46 @@
+import asyncio
+import sys
+import time
+
+import practice
+
+# Corre la misma carga (N tareas de I/O simulado) con las tres estrategias
+# de practice.py y compara el tiempo total de cada una.
+
+STRATEGIES = {
+    'threads': practice.threadingTasks,
+    'processes': practice.multiprocessingTasks,
+    'asyncio': practice.asyncioTasks,
+}
+
+
+async def measure(name, tasks, seconds):
+    practice.iterations_ammount = tasks
+    practice.task_seconds = seconds
+    # Sin prints por tarea: se mide la estrategia y no la terminal
+    practice.verbose = False
+    start = time.perf_counter()
+    await STRATEGIES[name]()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<10} tareas={tasks:<6} espera={seconds}s  {elapsed:8.2f}s  "
+          f"{tasks / elapsed:10,.0f} tareas/s")
+
+
+async def main(tasks, seconds):
+    for name in STRATEGIES:
+        await measure(name, tasks, seconds)
+
+    # Trabajo de CPU: mismo cálculo en el loop (bloqueante) y en un ProcessPoolExecutor
+    sizes = [1_000_000] * 8
+    start = time.perf_counter()
+    [practice.cpu_task(n) for n in sizes]
+    print(f"{'cpu inline':<10} {time.perf_counter() - start:8.2f}s")
+    start = time.perf_counter()
+    await practice.cpuTasks(sizes)
+    print(f"{'cpu procs':<10} {time.perf_counter() - start:8.2f}s")
+
+
+if __name__ == "__main__":
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 0.5
+    asyncio.run(main(tasks, seconds))
@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from collections import defaultdict
+
+from root_modules import import_root
+
+# pool_utils.py está en la raíz del repositorio (lo comparte con csv_parallel.py)
+auto_chunksize = import_root('pool_utils').auto_chunksize
+
+# Runner de trabajos sobre multiprocessing.Pool:
+# - los resultados vuelven con imap_unordered a medida que terminan
+# - chunksize calculado según la cantidad de tareas y de workers
+# - tiempo de trabajo por proceso worker
+# - contador en vivo de tareas completadas por segundo
+# - si una tarea falla, se cancela el resto del pool
+
+
+class JobFailed(Exception):
+    def __init__(self, index, item, details):
+        super().__init__(f"La tarea {index} ({item!r}) falló:\n{details}")
+        self.index = index
+        self.item = item
+
+
+def _call(job):
+    # Se ejecuta en el worker: nunca deja escapar la excepción para poder cancelar rápido
+    func, index, item = job
+    start = time.perf_counter()
+    try:
+        value = func(item)
+        ok = True
+    except Exception:
+        value = traceback.format_exc()
+        ok = False
+    return ok, index, value, os.getpid(), time.perf_counter() - start
+
+
+def run_jobs(func, items, workers=None, chunksize=None, progress=True, interval=0.5):
+    """
+    Ejecuta func(item) para cada item en un pool de procesos.
+
+    Parámetros:
+    func: Función a nivel de módulo (tiene que poder serializarse con pickle)
+    items: Elementos a procesar
+    workers (int): Procesos del pool (por defecto, cantidad de cores)
+    chunksize (int): Tareas por envío a cada worker (por defecto, automático)
+    progress (bool): Muestra el contador en vivo en stderr
+    interval (float): Segundos entre actualizaciones del contador
+
+    Retorna:
+    tuple: (resultados en el orden de items, estadísticas por worker)
+
+    Lanza JobFailed con la primera tarea que falle.
+    """
+    items = list(items)
+    workers = workers or os.cpu_count()
+    chunksize = chunksize or auto_chunksize(len(items), workers)
+    results = [None] * len(items)
+    worker_stats = defaultdict(lambda: {'tasks': 0, 'seconds': 0.0})
+
+    start = last_report = time.perf_counter()
+    done = 0
+    with multiprocessing.Pool(workers) as pool:
+        jobs = ((func, index, item) for index, item in enumerate(items))
+        for ok, index, value, pid, seconds in pool.imap_unordered(_call, jobs, chunksize=chunksize):
+            if not ok:
+                # Salir del with llama a pool.terminate(): se cancelan las tareas pendientes
+                raise JobFailed(index, items[index], value)
+            results[index] = value
+            worker_stats[pid]['tasks'] += 1
+            worker_stats[pid]['seconds'] += seconds
+            done += 1
+
+            now = time.perf_counter()
+            if progress and (now - last_report >= interval or done == len(items)):
+                rate = done / (now - start) if now > start else 0.0
+                sys.stderr.write(f"\r{done}/{len(items)} completadas ({rate:,.0f}/s)")
+                sys.stderr.flush()
+                last_report = now
+    if progress:
+        sys.stderr.write("\n")
+    return results, dict(worker_stats)
+
+
+def print_worker_stats(worker_stats):
+    for pid, stats in sorted(worker_stats.items()):
+        print(f"worker {pid}: {stats['tasks']} tareas, {stats['seconds']:.2f}s de trabajo")
@@ -1,11 +1,15 @@
-import multiprocessing
+import sys
+
+from job_runner import print_worker_stats, run_jobs
 
 def proccess_data(data):
-    print(f"Procesando datos: {data}")
+    # Sin print por elemento: cada print cruza de proceso a stdout y cuesta más que el trabajo
     return data
 
 if __name__ == "__main__":
     numbers = range(10000)
-    with multiprocessing.Pool() as pool:
-        results = pool.map(proccess_data, numbers)
-        print(results)
\ No newline at end of file
+    results, worker_stats = run_jobs(proccess_data, numbers)
+    print(f"Resultados: {len(results)} (primeros: {results[:10]})")
+    print_worker_stats(worker_stats)
+    if '--show' in sys.argv:
+        print(results)
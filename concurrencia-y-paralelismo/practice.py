@@ -1,7 +1,13 @@
-import threading
+import sys
 import time
-import multiprocessing
 import asyncio
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from bounded_executor import BoundedExecutor
+from job_runner import print_worker_stats, run_jobs
+from root_modules import import_root
 
 RED = "\033[31m"
 GREEN = "\033[32m"
@@ -10,38 +16,89 @@ YELLOW = "\033[33m"
 RESET = "\033[0m"
 
 iterations_ammount = 300
+max_workers = 50  # Hilos del SO como máximo, sin importar la cantidad de tareas
+max_concurrent = 100  # Corrutinas esperando I/O al mismo tiempo
+task_seconds = 2
+verbose = True
 
-def task(args):
-    print(f"{YELLOW}Task started: {args}{RESET}")
-    time.sleep(2)
-    print(f"{GREEN}Task finished: {args}{RESET}")
+def task(args, seconds=None, show=None):
+    # seconds/show se pasan explícitos a los procesos hijos (con spawn no heredan los globales)
+    seconds = task_seconds if seconds is None else seconds
+    show = verbose if show is None else show
+    if show:
+        print(f"{YELLOW}Task started: {args}{RESET}")
+    time.sleep(seconds)
+    if show:
+        print(f"{GREEN}Task finished: {args}{RESET}")
+    return args
 
-async def threadingTasks():
-    threads = []
-    for i in range(iterations_ammount):
-        thread = threading.Thread(target=task, args=(f"thread: {i}",))
-        threads.append(thread)
-        thread.start()
+async def async_task(args):
+    # asyncio.sleep cede el control al event loop: las demás tareas avanzan mientras tanto
+    if verbose:
+        print(f"{YELLOW}Task started: {args}{RESET}")
+    await asyncio.sleep(task_seconds)
+    if verbose:
+        print(f"{GREEN}Task finished: {args}{RESET}")
+    return args
 
-    for thread in threads:
-        thread.join()
+def cpu_task(n):
+    # Trabajo de CPU puro: en un hilo bloquearía al event loop (y al GIL)
+    return sum(i * i for i in range(n))
+
+async def threadingTasks():
+    # Pool acotado en lugar de un threading.Thread por tarea.
+    # to_thread evita que la espera bloquee al event loop
+    with BoundedExecutor(max_workers=max_workers) as executor:
+        args = [f"thread: {i}" for i in range(iterations_ammount)]
+        return await asyncio.to_thread(executor.map, task, args)
 
 async def multiprocessingTasks():
-    with multiprocessing.Pool() as pool:
-        args = [f"multiprocessing: {i}" for i in range(iterations_ammount)]
-        results = pool.map(task, args)
-        print(results)
+    # El pool dentro de una corrutina bloquea el loop; run_in_executor no
+    loop = asyncio.get_running_loop()
+    args = [f"multiprocessing: {i}" for i in range(iterations_ammount)]
+    worker = partial(task, seconds=task_seconds, show=verbose)
+    results, worker_stats = await loop.run_in_executor(
+        None, partial(run_jobs, worker, args, progress=verbose)
+    )
+    if verbose:
+        print_worker_stats(worker_stats)
+    return results
+
+async def asyncioTasks():
+    # El semáforo limita cuántas corrutinas están activas a la vez
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def limited(args):
+        async with semaphore:
+            return await async_task(args)
+
+    return await asyncio.gather(*(limited(f"asyncio: {i}") for i in range(iterations_ammount)))
+
+async def cpuTasks(sizes):
+    # El trabajo de CPU se manda a otros procesos; el loop sigue libre para el I/O
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor() as executor:
+        return await asyncio.gather(*(loop.run_in_executor(executor, cpu_task, n) for n in sizes))
 
 async def main():
-    print(f"--- Main thread started ---")
-    await threadingTasks()
-    print(f"--- Main thread finished ---")
-    print(f"--- Main process started ---")
-    await multiprocessingTasks()
-    print(f"--- Main process finished ---")
+    # python practice.py --trace: instrumenta el event loop y guarda practice_trace.json
+    # (loop_instrumentation.py está en la raíz del repositorio y solo se carga con --trace)
+    if '--trace' in sys.argv:
+        medir = import_root('loop_instrumentation').instrument(trace_path='practice_trace.json')
+    else:
+        medir = nullcontext()
+    with medir:
+        print(f"--- Main thread started ---")
+        await threadingTasks()
+        print(f"--- Main thread finished ---")
+        print(f"--- Main process started ---")
+        await multiprocessingTasks()
+        print(f"--- Main process finished ---")
+        print(f"--- Asyncio started ---")
+        # El I/O asíncrono y el trabajo de CPU en otros procesos se solapan
+        await asyncio.gather(asyncioTasks(), cpuTasks([2_000_000] * 4))
+        print(f"--- Asyncio finished ---")
 
 
 if __name__ == "__main__":
    asyncio.run(main())
-
-   
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Acceso a los módulos de la raíz del repositorio (pool_utils.py, loop_instrumentation.py)
+desde los scripts de esta carpeta.
+
+Así `python parallel_understand.py` o `python practice.py` funcionan desde acá sin
+configurar PYTHONPATH y sin agregar nada a sys.path.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_root(name):
+    """
+    Importa un módulo de la raíz del repositorio.
+
+    Si ya es importable (por ejemplo con PYTHONPATH=.) se usa el import normal;
+    si no, se carga desde su archivo y se registra en sys.modules con el mismo nombre.
+
+    Retorna:
+    module: El módulo importado
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    try:
+        return importlib.import_module(name)
+    except ModuleNotFoundError as e:
+        if e.name != name:
+            raise
+    spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT, f"{name}.py"))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
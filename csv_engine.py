@@ -0,0 +1,104 @@
+"""
+Motor de transformación de CSV por streaming.
+
+Lee el archivo de entrada en bloques (chunks) de tamaño fijo, trabaja con
+tuplas en lugar de diccionarios y escribe cada bloque con writerows, así la
+memoria usada no depende del tamaño del archivo.
+"""
+
+import csv
+import time
+from itertools import islice
+
+
+def total_value(price, quantity):
+    """Calcula el valor total de un producto (precio * cantidad)"""
+    return float(price) * float(quantity)
+
+
+# Columnas derivadas por defecto: nombre -> (función, columnas de origen)
+DERIVED_COLUMNS = {
+    'total_value': (total_value, ('price', 'quantity')),
+}
+
+
+def transform_rows(rows, indexes, derived):
+    """
+    Transforma un bloque de filas (listas de strings) en tuplas de salida.
+
+    Parámetros:
+    rows (list): Filas leídas por csv.reader
+    indexes (tuple): Posiciones de las columnas que se copian tal cual
+    derived (list): Pares (función, posiciones de origen) por columna derivada
+
+    Retorna:
+    list: Tuplas listas para csv.writer.writerows
+    """
+    output = []
+    for row in rows:
+        values = [row[i] for i in indexes]
+        for func, sources in derived:
+            values.append(func(*[row[i] for i in sources]))
+        output.append(tuple(values))
+    return output
+
+
+def compile_columns(header, columns, derived_columns):
+    # Convierte nombres de columna en posiciones una sola vez (no por fila)
+    position = {name: i for i, name in enumerate(header)}
+    indexes = tuple(position[name] for name in columns)
+    derived = [
+        (func, tuple(position[name] for name in sources))
+        for func, sources in derived_columns.values()
+    ]
+    return indexes, derived
+
+
+def transform_csv(input_path, output_path, columns, derived_columns=None, chunk_size=10_000):
+    """
+    Copia las columnas indicadas de input_path a output_path y agrega las
+    columnas derivadas, procesando el archivo en bloques de chunk_size filas.
+
+    Parámetros:
+    input_path (str): CSV de entrada (con cabecera)
+    output_path (str): CSV de salida
+    columns (list): Columnas de entrada que se copian sin cambios
+    derived_columns (dict): nombre -> (función, columnas de origen)
+    chunk_size (int): Cantidad de filas por bloque
+
+    Retorna:
+    dict: Filas procesadas, segundos y filas por segundo
+    """
+    if derived_columns is None:
+        derived_columns = DERIVED_COLUMNS
+
+    start = time.perf_counter()
+    total_rows = 0
+
+    with open(input_path, mode='r', newline='') as source, \
+            open(output_path, mode='w', newline='') as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+
+        header = next(reader)
+        indexes, derived = compile_columns(header, columns, derived_columns)
+        writer.writerow(list(columns) + list(derived_columns))
+
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            writer.writerows(transform_rows(chunk, indexes, derived))
+            total_rows += len(chunk)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': total_rows,
+        'seconds': elapsed,
+        'rows_per_sec': total_rows / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_report(stats):
+    print(f"Filas procesadas: {stats['rows']} en {stats['seconds']:.4f}s "
+          f"({stats['rows_per_sec']:,.0f} filas/s)")
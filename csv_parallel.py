@@ -0,0 +1,149 @@
+"""
+Procesamiento paralelo de products.csv por shards.
+
+Parte del ejemplo de concurrencia-y-paralelismo/parallel_understand.py
+(multiprocessing.Pool) pero con trabajo real:
+
+1. El archivo se divide en rangos de bytes (shards) alineados a líneas
+2. Cada proceso transforma su shard con csv_engine y lo escribe a un archivo parcial
+3. Los parciales se concatenan en orden detrás de la cabecera
+"""
+
+import csv
+import io
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+from csv_engine import DERIVED_COLUMNS, compile_columns, transform_rows
+from mmap_reader import MappedFile
+from pool_utils import auto_chunksize
+
+SHARD_BYTES = 16 * 1024 * 1024  # Tamaño objetivo de cada shard
+
+
+def record_start(mapped, start, offset):
+    """
+    Primer comienzo de registro CSV en offset o después, sabiendo que start es uno.
+
+    Un salto de línea dentro de un campo entre comillas no termina el registro: si
+    la cantidad de comillas entre start y el salto es impar se sigue con el próximo
+    (las comillas escapadas "" vienen de a pares y no cambian la paridad).
+    """
+    boundary = mapped.line_start(offset)
+    quotes = mapped.map[start:boundary].count(b'"') if mapped.map is not None else 0
+    while quotes % 2 and boundary < len(mapped):
+        following = mapped.line_start(boundary + 1)
+        quotes += mapped.map[boundary:following].count(b'"')
+        boundary = following
+    return boundary
+
+
+def shard_ranges(path, shard_bytes=SHARD_BYTES):
+    """
+    Divide el CSV (sin la cabecera) en rangos de bytes que empiezan y
+    terminan en un límite de registro (nunca dentro de un campo entre comillas).
+
+    Retorna:
+    tuple: (cabecera como lista, lista de rangos (inicio, fin))
+    """
+    with MappedFile(path) as mapped:
+        size = len(mapped)
+        data_start = record_start(mapped, 0, 1)
+        header = next(csv.reader(io.StringIO(bytes(mapped.view[:data_start]).decode('utf-8'), newline='')))
+        bounds = [data_start]
+        for offset in range(data_start + shard_bytes, size, shard_bytes):
+            if offset > bounds[-1]:
+                bounds.append(record_start(mapped, bounds[-1], offset))
+        bounds.append(size)
+    ranges = [(bounds[i], bounds[i + 1]) for i in range(len(bounds) - 1) if bounds[i] < bounds[i + 1]]
+    return header, ranges
+
+
+def process_shard(args):
+    """Transforma un shard y lo escribe en un archivo parcial (se ejecuta en el worker)"""
+    path, start, end, part_path, indexes, derived = args
+    with open(path, mode='rb') as file:
+        file.seek(start)
+        data = file.read(end - start).decode('utf-8')
+    rows = list(csv.reader(io.StringIO(data, newline='')))
+    with open(part_path, mode='w', newline='') as part:
+        csv.writer(part).writerows(transform_rows(rows, indexes, derived))
+    return len(rows)
+
+
+def transform_csv_parallel(input_path, output_path, columns, derived_columns=None,
+                           workers=None, shard_bytes=SHARD_BYTES):
+    """
+    Igual que csv_engine.transform_csv pero repartiendo shards entre procesos.
+    Las funciones derivadas deben poder serializarse con pickle (funciones de módulo).
+
+    Retorna:
+    dict: Filas, segundos, filas por segundo, workers, shards y chunksize
+    """
+    if derived_columns is None:
+        derived_columns = DERIVED_COLUMNS
+    workers = workers or os.cpu_count()
+
+    start = time.perf_counter()
+    header, ranges = shard_ranges(input_path, shard_bytes)
+    indexes, derived = compile_columns(header, columns, derived_columns)
+    chunksize = auto_chunksize(len(ranges), workers)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tasks = [
+            (input_path, shard_start, shard_end, os.path.join(tmp, f"part_{i}.csv"), indexes, derived)
+            for i, (shard_start, shard_end) in enumerate(ranges)
+        ]
+        with multiprocessing.Pool(workers) as pool:
+            # imap conserva el orden de los shards
+            total_rows = sum(pool.imap(process_shard, tasks, chunksize=chunksize))
+
+        with open(output_path, mode='w', newline='') as target:
+            csv.writer(target).writerow(list(columns) + list(derived_columns))
+            for task in tasks:
+                with open(task[3], mode='r', newline='') as part:
+                    shutil.copyfileobj(part, target)
+
+    elapsed = time.perf_counter() - start
+    return {
+        'rows': total_rows,
+        'seconds': elapsed,
+        'rows_per_sec': total_rows / elapsed if elapsed > 0 else 0.0,
+        'workers': workers,
+        'shards': len(ranges),
+        'chunksize': chunksize,
+    }
+
+
+def measure_scaling(input_path, output_path, columns, shard_bytes=SHARD_BYTES):
+    """Corre el pipeline con 1, 2, 4... workers hasta la cantidad de cores y muestra el speedup"""
+    counts = []
+    workers = 1
+    while workers < os.cpu_count():
+        counts.append(workers)
+        workers *= 2
+    counts.append(os.cpu_count())
+
+    baseline = None
+    for workers in counts:
+        stats = transform_csv_parallel(input_path, output_path, columns, workers=workers,
+                                       shard_bytes=shard_bytes)
+        baseline = baseline or stats['seconds']
+        print(f"workers={workers:<3} shards={stats['shards']:<5} chunksize={stats['chunksize']:<3} "
+              f"{stats['seconds']:.2f}s ({stats['rows_per_sec']:,.0f} filas/s) "
+              f"speedup={baseline / stats['seconds']:.2f}x")
+
+
+if __name__ == "__main__":
+    import sys
+    from benchmark_csv import generate_products
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'products.csv')
+        print(f"Generando {rows:,} filas...")
+        generate_products(source, rows)
+        measure_scaling(source, os.path.join(tmp, 'products_updated.csv'), ['name', 'price', 'quantity'])
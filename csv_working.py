@@ -1,20 +1,25 @@
-import csv
+import sys
+
+from csv_engine import transform_csv, print_report
+from csv_columnar import transform_csv_columnar
+from csv_parallel import transform_csv_parallel
 
 field_names = ['name', 'price', 'quantity', 'total_value']
 
-#Leer un archivo
-with open('products.csv', mode='r') as file:
-    csv_reader = csv.DictReader(file)
-    
-    with open('products_updated.csv', mode='w') as file:
-        csv_writer = csv.DictWriter(file, fieldnames=field_names)
-        csv_writer.writeheader()
-        for row in csv_reader:
-            csv_writer.writerow(
-                {
-                    'name': row['name'],
-                    'price': row['price'],
-                    'quantity': row['quantity'],
-                    'total_value': float(row['price']) * float(row['quantity'])
-                }
-            )
+# Modos opcionales: python csv_working.py [--columnar | --parallel]
+if '--columnar' in sys.argv:
+    transform = transform_csv_columnar
+elif '--parallel' in sys.argv:
+    transform = transform_csv_parallel
+else:
+    transform = transform_csv
+
+# El guard es necesario para multiprocessing en sistemas que usan spawn (Windows/macOS)
+if __name__ == "__main__":
+    #Leer un archivo por bloques y escribir el archivo actualizado con total_value
+    stats = transform(
+        'products.csv',
+        'products_updated.csv',
+        columns=field_names[:3],
+    )
+    print_report(stats)
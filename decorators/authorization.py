@@ -0,0 +1,169 @@
+import functools
+import threading
+import time
+from collections import OrderedDict
+
+# Subsistema de autorización basado en check_access (decorator_3.py / anidate_deco.py):
+# - jerarquía de roles: admin hereda todo lo de manager y manager lo de employee
+# - permisos precompilados: un frozenset de acciones por rol, calculado una sola vez
+# - roles leídos del propio empleado o de una fuente externa (role_source), con un
+#   cache LRU con TTL de decisiones (id del empleado, acción) para esa fuente
+# - chequeo por lote de una lista completa de empleados en una llamada
+
+ROLE_HIERARCHY = {
+    'admin': {'manager'},
+    'manager': {'employee'},
+    'employee': set(),
+}
+
+ROLE_PERMISSIONS = {
+    'employee': {'view_profile'},
+    'manager': {'approve_vacation', 'view_reports'},
+    'admin': {'delete_employee', 'change_role'},
+}
+
+
+def compile_roles(hierarchy):
+    """Para cada rol, el conjunto de roles que incluye (él mismo y todos los heredados)"""
+    compiled = {}
+
+    def expand(role, visiting=()):
+        if role in compiled:
+            return compiled[role]
+        if role in visiting:
+            raise ValueError(f'Cyclic role hierarchy at {role!r}')
+        roles = {role}
+        for child in hierarchy.get(role, ()):
+            roles |= expand(child, visiting + (role,))
+        compiled[role] = frozenset(roles)
+        return compiled[role]
+
+    for role in hierarchy:
+        expand(role)
+    return compiled
+
+
+def compile_permissions(hierarchy, permissions):
+    """Para cada rol, todas las acciones permitidas incluyendo las heredadas"""
+    return {
+        role: frozenset().union(*(permissions.get(included, ()) for included in roles))
+        for role, roles in compile_roles(hierarchy).items()
+    }
+
+
+class Authorizer:
+    def __init__(self, hierarchy=ROLE_HIERARCHY, permissions=ROLE_PERMISSIONS, role_source=None,
+                 cache_size=10_000, ttl=60.0):
+        # Función empleado -> rol (p. ej. una consulta a la base o a un directorio).
+        # None usa employee['role']: la decisión es solo una búsqueda en un set y no se cachea
+        self.role_source = role_source
+        self.cache_size = cache_size  # Solo se usa con role_source; 0 desactiva el cache
+        self.ttl = ttl  # Segundos que un rol leído de role_source se sigue usando sin volver a pedirlo
+        self.cache = OrderedDict()  # (id del empleado, acción) -> (decisión, vence)
+        self.lock = threading.Lock()  # El OrderedDict no tolera move_to_end/popitem concurrentes
+        self.hits = 0
+        self.misses = 0
+        self.load_policy(hierarchy, permissions)
+
+    def load_policy(self, hierarchy, permissions):
+        """Recompila roles y permisos; las decisiones cacheadas dejan de valer"""
+        self.roles = compile_roles(hierarchy)
+        self.permissions = compile_permissions(hierarchy, permissions)
+        with self.lock:
+            self.cache.clear()
+
+    def _employee_id(self, employee):
+        # La clave del cache tiene que identificar a una sola persona: el nombre no sirve
+        # (dos "Ana" compartirían decisiones) y sin id todos caerían en la misma clave
+        employee_id = employee.get('id')
+        if employee_id is None:
+            raise ValueError(f"Employee {employee.get('name')!r} has no 'id': required to cache decisions")
+        return employee_id
+
+    def _role(self, employee):
+        return self.role_source(employee) if self.role_source else employee.get('role')
+
+    def _decide(self, role, action):
+        return action in self.permissions.get(role, ())
+
+    def is_allowed(self, employee, action):
+        if self.role_source is None or not self.cache_size:
+            return self._decide(self._role(employee), action)
+        # El rol viene de afuera y puede cambiar: la clave no lo incluye y el TTL
+        # acota cuánto tiempo se usa una decisión tomada con un rol viejo
+        key = self._employee_id(employee), action
+        now = time.monotonic()
+        with self.lock:
+            cached = self.cache.get(key)
+            if cached is not None and cached[1] > now:
+                self.hits += 1
+                self.cache.move_to_end(key)
+                return cached[0]
+            self.misses += 1
+
+        # role_source puede ser lento (base, red): se consulta fuera del lock
+        decision = self._decide(self._role(employee), action)
+        with self.lock:
+            self.cache[key] = (decision, now + self.ttl)
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)  # El menos usado recientemente
+        return decision
+
+    def has_role(self, employee, required_role):
+        return required_role in self.roles.get(self._role(employee), ())
+
+    def check_many(self, employees, action):
+        """
+        Autoriza una lista de empleados para una acción.
+
+        Retorna:
+        list: Un bool por empleado, en el mismo orden
+        """
+        if self.role_source is not None:
+            # Cada empleado necesita su rol de la fuente: se aprovecha el cache si está activo
+            return [self.is_allowed(employee, action) for employee in employees]
+        # Un solo cálculo por rol distinto del lote
+        by_role = {}
+        results = []
+        for employee in employees:
+            role = employee.get('role')
+            if role not in by_role:
+                by_role[role] = self._decide(role, action)
+            results.append(by_role[role])
+        return results
+
+    def invalidate(self, employee=None):
+        """Borra las decisiones cacheadas de un empleado (o todas)"""
+        with self.lock:
+            if employee is None:
+                self.cache.clear()
+                return
+            employee_id = self._employee_id(employee)
+            for key in [key for key in self.cache if key[0] == employee_id]:
+                del self.cache[key]
+
+    def require(self, action):
+        """Decorador: solo ejecuta la función si el empleado puede realizar `action`"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(employee, *args, **kwargs):
+                if not self.is_allowed(employee, action):
+                    raise PermissionError(f"{employee.get('name')} cannot {action}")
+                return func(employee, *args, **kwargs)
+            return wrapper
+        return decorator
+
+    def check_access(self, required_role):
+        """Como check_access original pero respetando la jerarquía de roles"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(employee, *args, **kwargs):
+                if not self.has_role(employee, required_role):
+                    raise PermissionError(f"Only {required_role} can perform this action")
+                return func(employee, *args, **kwargs)
+            return wrapper
+        return decorator
+
+
+authorizer = Authorizer()
@@ -0,0 +1,85 @@
+import os
+import random
+import sqlite3
+import timeit
+from contextlib import redirect_stdout
+
+from authorization import Authorizer
+
+# Compara el check_access original (print por cada rechazo) con el Authorizer,
+# y el cache de decisiones cuando el rol se lee de una base (role_source)
+
+
+def check_access(required_role):
+    # Copia del decorador de decorator_3.py (ese archivo ejecuta su demo al importarlo)
+    def decorator(func):
+        def wrapper(employee):
+            if employee.get('role') == required_role:
+                return func(employee)
+            else:
+                print(f'ACCESO DENEGAGO. Solo {required_role} pueden realizar esta acción')
+        return wrapper
+    return decorator
+
+
+def delete_employee(employee):
+    return employee['name']
+
+
+if __name__ == "__main__":
+    roles = ['admin', 'manager', 'employee']
+    employees = [{'id': i, 'name': f'emp_{i}', 'role': random.choice(roles)} for i in range(10_000)]
+    authorizer = Authorizer()
+
+    original = check_access('admin')(delete_employee)
+    required = authorizer.require('delete_employee')(delete_employee)
+
+    def run_original():
+        for employee in employees:
+            original(employee)
+
+    def run_require():
+        for employee in employees:
+            try:
+                required(employee)
+            except PermissionError:
+                pass
+
+    def run_is_allowed():
+        for employee in employees:
+            authorizer.is_allowed(employee, 'delete_employee')
+
+    def run_batch():
+        authorizer.check_many(employees, 'delete_employee')
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        seconds = min(timeit.repeat(run_original, number=10, repeat=3))
+    print(f"{'check_access original':<30} {len(employees) * 10 / seconds:>12,.0f} chequeos/s")
+
+    for name, func in [('require', run_require),
+                       ('is_allowed', run_is_allowed),
+                       ('check_many (lote)', run_batch)]:
+        seconds = min(timeit.repeat(func, number=10, repeat=3))
+        print(f"{name:<30} {len(employees) * 10 / seconds:>12,.0f} chequeos/s")
+
+    # Rol leído de una tabla en cada chequeo: acá el cache sí evita trabajo
+    db = sqlite3.connect(':memory:')
+    db.execute('CREATE TABLE employees (id INTEGER PRIMARY KEY, role TEXT)')
+    db.executemany('INSERT INTO employees VALUES (?, ?)', [(e['id'], e['role']) for e in employees])
+
+    def role_from_db(employee):
+        row = db.execute('SELECT role FROM employees WHERE id = ?', (employee['id'],)).fetchone()
+        return row[0] if row else None
+
+    from_db = Authorizer(role_source=role_from_db, cache_size=0)
+    from_db_cached = Authorizer(role_source=role_from_db, cache_size=len(employees))
+    for name, checker in [('role_source sin cache', from_db), ('role_source con cache LRU', from_db_cached)]:
+        seconds = min(timeit.repeat(lambda: checker.check_many(employees, 'delete_employee'), number=10, repeat=3))
+        print(f"{name:<30} {len(employees) * 10 / seconds:>12,.0f} chequeos/s")
+    print(f"cache: {from_db_cached.hits:,} aciertos, {from_db_cached.misses:,} fallos")
+
+    # Un cambio de rol se ve recién al vencer el TTL o al invalidar al empleado
+    employee = employees[0]
+    db.execute('UPDATE employees SET role = ? WHERE id = ?', ('admin', employee['id']))
+    from_db_cached.invalidate(employee)
+    print(f"después de ascender a {employee['name']}: {from_db_cached.is_allowed(employee, 'delete_employee')}")
@@ -0,0 +1,55 @@
+import logging
+import os
+import timeit
+from contextlib import redirect_stdout
+
+import log_toolkit
+
+# Mide el costo por llamada de cada forma de decorar la misma función
+
+
+def process_payment(amount):
+    return amount * 2
+
+
+def print_wrapper(func):
+    # El patrón original: un frame extra y un print en cada llamada
+    def wrapper(*args):
+        print('1 Log de la transacción...')
+        result = func(*args)
+        print('3 Log terminado...')
+        return result
+    return wrapper
+
+
+def measure(name, func, number=200_000, baseline=None):
+    seconds = min(timeit.repeat(lambda: func(10), number=number, repeat=3))
+    per_call = seconds / number * 1e9
+    extra = f"  (+{per_call - baseline:.0f} ns)" if baseline is not None else ''
+    print(f"{name:<36} {per_call:8.0f} ns/llamada{extra}")
+    return per_call
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
+    base = measure('sin decorar', process_payment)
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        original = print_wrapper(process_payment)
+        seconds = min(timeit.repeat(lambda: original(10), number=200_000, repeat=3))
+    print(f"{'wrapper con print (a /dev/null)':<36} {seconds / 200_000 * 1e9:8.0f} ns/llamada")
+
+    measure('log_transaction, nivel desactivado', log_toolkit.log_transaction(process_payment), baseline=base)
+    measure('log_call, nivel desactivado', log_toolkit.log_call(process_payment), baseline=base)
+
+    log_toolkit.logger.addHandler(logging.NullHandler())
+    log_toolkit.logger.propagate = False
+    log_toolkit.logger.setLevel(logging.INFO)
+    measure('log_call, emitiendo a NullHandler', log_toolkit.log_call(process_payment), number=50_000, baseline=base)
+
+    log_toolkit.set_enabled(False)
+    measure('log_call con ENABLED = False', log_toolkit.log_call(process_payment), baseline=base)
+
+    log_toolkit.set_enabled(True)
+    decorated = log_toolkit.log_call(process_payment)
+    print(f"\nfunctools.wraps conserva: {decorated.__name__} {decorated.__wrapped__ is process_payment}")
@@ -1,8 +1,11 @@
+from functools import wraps
+
 def my_decorator(func):
     # el core del decorador siempre se ejecuta al invocar @my_decorator
+    @wraps(func)  # conserva nombre y docstring de func
     def wrapper(name):
         print('decorator')
-        func(name)
+        return func(name)
     return wrapper
   
 
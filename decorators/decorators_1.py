@@ -1,8 +1,12 @@
+from functools import wraps
+
 def log_transaction(func):
-    def wrapper():
+    @wraps(func)  # conserva nombre y docstring de func
+    def wrapper(*args, **kwargs):
         print('1 Log de la transacción...')
-        func()
+        result = func(*args, **kwargs)
         print('3 Log terminado...')
+        return result
     return wrapper
         
 
@@ -0,0 +1,82 @@
+import functools
+import logging
+import os
+
+# Decoradores de logging listos para producción, basados en log_action,
+# log_transaction y my_decorator:
+# - usan functools.wraps (nombre, docstring y firma de la función original)
+# - siempre devuelven el valor de la función decorada
+# - formatean el mensaje solo si el logger va a emitirlo (formateo perezoso)
+# - con ENABLED = False devuelven la función sin decorar: costo cero por llamada
+
+logger = logging.getLogger('decorators')
+
+# Se lee al decorar: hay que cambiarlo antes de importar los módulos que usan los decoradores
+ENABLED = os.environ.get('LOG_DECORATORS', '1') != '0'
+
+
+def set_enabled(enabled: bool):
+    global ENABLED
+    ENABLED = enabled
+
+
+def log_call(func=None, *, level=logging.INFO, log=None):
+    """
+    Registra cada llamada con sus argumentos y el valor devuelto.
+
+    Se puede usar como @log_call o @log_call(level=logging.DEBUG).
+    """
+    if func is None:
+        return functools.partial(log_call, level=level, log=log)
+    if not ENABLED:
+        return func
+    log = log or logger
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not log.isEnabledFor(level):
+            return func(*args, **kwargs)
+        # Los argumentos se pasan sueltos: logging arma el string solo si el mensaje se emite
+        log.log(level, 'llamando %s args=%r kwargs=%r', name, args, kwargs)
+        result = func(*args, **kwargs)
+        log.log(level, '%s devolvió %r', name, result)
+        return result
+    return wrapper
+
+
+def log_action(func=None, *, level=logging.INFO, log=None):
+    """Versión de log_action que registra el nombre del empleado (primer argumento)"""
+    if func is None:
+        return functools.partial(log_action, level=level, log=log)
+    if not ENABLED:
+        return func
+    log = log or logger
+
+    @functools.wraps(func)
+    def wrapper(employee, *args, **kwargs):
+        if log.isEnabledFor(level):
+            log.log(level, 'Registrando acción para el empleado %s', employee.get('name'))
+        return func(employee, *args, **kwargs)
+    return wrapper
+
+
+def log_transaction(func=None, *, level=logging.INFO, log=None):
+    """Versión de log_transaction: registra inicio y fin y devuelve el resultado"""
+    if func is None:
+        return functools.partial(log_transaction, level=level, log=log)
+    if not ENABLED:
+        return func
+    log = log or logger
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not log.isEnabledFor(level):
+            return func(*args, **kwargs)
+        log.log(level, 'Log de la transacción %s...', name)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            log.log(level, 'Log terminado %s...', name)
+    return wrapper
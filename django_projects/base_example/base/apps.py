@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class BaseConfig(AppConfig):
     name = 'base'
+
+    def ready(self):
+        # Registra los receivers que invalidan el cache de api_tareas
+        from . import signals  # noqa: F401
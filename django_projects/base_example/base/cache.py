@@ -0,0 +1,55 @@
+import hashlib
+import json
+import time
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+from .models import Tarea
+
+# Respuesta JSON de api_tareas guardada en el cache de Django junto con su
+# ETag y su fecha de modificación. La clave lleva un número de versión que las
+# señales de Tarea incrementan (ver signals.py): la próxima petición usa una
+# clave nueva y genera la respuesta otra vez.
+
+TAREAS_KEY = 'api_tareas:{version}'
+TAREAS_VERSION_KEY = 'api_tareas:version'
+TAREAS_MODIFIED_KEY = 'api_tareas:modified'
+# Aunque una invalidación se pierda, una entrada no se sirve más de esto
+TAREAS_TIMEOUT = 300
+
+
+def tareas_version():
+    # Si el cache descartó la versión se empieza con una nueva (time_ns), nunca usada antes:
+    # volver a 1 podría reencontrar una entrada vieja
+    return cache.get_or_set(TAREAS_VERSION_KEY, time.time_ns, timeout=None)
+
+
+def tareas_entry():
+    """Devuelve {'body', 'etag', 'last_modified'} desde el cache o generándolo"""
+    # La versión se lee antes que la base: si una invalidación llega mientras se arma
+    # el cuerpo, este queda guardado bajo la versión vieja, que ya nadie pide
+    key = TAREAS_KEY.format(version=tareas_version())
+    entry = cache.get(key)
+    if entry is None:
+        tareas = list(Tarea.objects.all().values('title', 'completed'))
+        body = json.dumps({"tareas": tareas}, cls=DjangoJSONEncoder).encode('utf-8')
+        # add() no pisa una fecha existente: solo se fija la primera vez o al invalidar
+        cache.add(TAREAS_MODIFIED_KEY, timezone.now().replace(microsecond=0), timeout=None)
+        entry = {
+            'body': body,
+            'etag': hashlib.sha1(body).hexdigest(),
+            'last_modified': cache.get(TAREAS_MODIFIED_KEY),
+        }
+        cache.set(key, entry, timeout=TAREAS_TIMEOUT)
+    return entry
+
+
+def invalidate_tareas():
+    try:
+        cache.incr(TAREAS_VERSION_KEY)
+    except ValueError:
+        # La versión no estaba en el cache
+        cache.set(TAREAS_VERSION_KEY, time.time_ns(), timeout=None)
+    cache.set(TAREAS_MODIFIED_KEY, timezone.now().replace(microsecond=0), timeout=None)
@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import JsonResponse
+from django.test import RequestFactory
+
+from base.cache import invalidate_tareas
+from base.models import Tarea
+from base.views import api_tareas
+
+
+def api_tareas_sin_cache(request):
+    # La vista original: consulta y serializa en cada petición
+    tareas = Tarea.objects.all().values('title', 'completed')
+    return JsonResponse({"tareas": list(tareas)})
+
+
+class Command(BaseCommand):
+    help = 'Mide peticiones por segundo de api_tareas con y sin cache (y con respuestas 304)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tareas', type=int, default=1_000)
+        parser.add_argument('--requests', type=int, default=2_000)
+
+    def handle(self, *args, **options):
+        # Las tareas que se insertan para medir se borran al terminar: la base queda como estaba
+        last_pk = Tarea.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        try:
+            missing = options['tareas'] - Tarea.objects.count()
+            if missing > 0:
+                Tarea.objects.bulk_create([Tarea(title=f'tarea {i}') for i in range(missing)])
+                invalidate_tareas()  # bulk_create no dispara post_save
+            self.run(options)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {Tarea._meta.db_table} WHERE id > %s', [last_pk])
+            invalidate_tareas()  # El DELETE directo tampoco dispara señales
+
+    def run(self, options):
+        factory = RequestFactory()
+        total = options['requests']
+
+        def measure(name, view, **headers):
+            # Una petición nueva por llamada: api_tareas guarda la entrada del cache en el request
+            requests = [factory.get('/api/tareas/', **headers) for _ in range(total)]
+            start = time.perf_counter()
+            for request in requests:
+                response = view(request)
+            elapsed = time.perf_counter() - start
+            self.stdout.write(f'{name:<28} {total / elapsed:>10,.0f} req/s  (status {response.status_code})')
+            return response
+
+        measure('sin cache', api_tareas_sin_cache)
+        response = measure('con cache', api_tareas)
+        measure('304 por ETag', api_tareas, HTTP_IF_NONE_MATCH=response['ETag'])
+        measure('304 por Last-Modified', api_tareas, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+
+        # Un cambio en Tarea invalida la respuesta cacheada
+        tarea = Tarea.objects.first()
+        tarea.completed = not tarea.completed
+        tarea.save()
+        after = api_tareas(factory.get('/api/tareas/', HTTP_IF_NONE_MATCH=response['ETag']))
+        self.stdout.write(f'después de guardar una Tarea: status {after.status_code}')
+        tarea.completed = not tarea.completed
+        tarea.save()
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_tareas
+from .models import Tarea
+
+# Ojo: QuerySet.update() y bulk_create() no disparan estas señales;
+# después de usarlos hay que llamar a invalidate_tareas() a mano.
+
+
+@receiver(post_save, sender=Tarea)
+@receiver(post_delete, sender=Tarea)
+def tarea_changed(sender, **kwargs):
+    invalidate_tareas()
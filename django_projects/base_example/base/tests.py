@@ -1,3 +1,73 @@
+import json
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+
+from .cache import TAREAS_VERSION_KEY
+from .models import Tarea
+
+
+class ApiTareasTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.tarea = Tarea.objects.create(title='comprar yerba')
+        Tarea.objects.create(title='lavar el mate', completed=True)
+        self.url = reverse('api_tareas')
+
+    def tareas(self, response):
+        return json.loads(response.content)['tareas']
+
+    def test_response_has_body_and_validators(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(self.tareas(response), [
+            {'title': 'comprar yerba', 'completed': False},
+            {'title': 'lavar el mate', 'completed': True},
+        ])
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+    def test_cached_response_does_not_query_database(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(len(self.tareas(response)), 2)
+
+    def test_304_for_current_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_304_for_current_last_modified(self):
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+
+    def test_save_invalidates_cached_response(self):
+        etag = self.client.get(self.url)['ETag']
+        self.tarea.completed = True
+        self.tarea.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertTrue(self.tareas(response)[0]['completed'])
+
+    def test_delete_invalidates_cached_response(self):
+        self.client.get(self.url)
+        self.tarea.delete()
+        self.assertEqual(self.tareas(self.client.get(self.url)), [{'title': 'lavar el mate', 'completed': True}])
+
+    def test_create_invalidates_cached_response(self):
+        self.client.get(self.url)
+        Tarea.objects.create(title='cebar')
+        self.assertEqual(len(self.tareas(self.client.get(self.url))), 3)
 
-# Create your tests here.
+    def test_lost_version_key_never_serves_stale_entry(self):
+        self.client.get(self.url)
+        # El cache descarta la versión y después cambia una tarea sin pasar por las señales
+        cache.delete(TAREAS_VERSION_KEY)
+        Tarea.objects.filter(pk=self.tarea.pk).update(title='comprar bizcochos')
+        self.assertEqual(self.tareas(self.client.get(self.url))[0]['title'], 'comprar bizcochos')
@@ -1,7 +1,7 @@
 from django.shortcuts import render
 from django.http import HttpResponse
-from django.http import JsonResponse
-from .models import Tarea
+from django.views.decorators.http import condition
+from .cache import tareas_entry
 
 # Create your views here.
 
@@ -9,6 +9,19 @@ def Home(request):
     return HttpResponse("<h1>¡Hola, Django! 👋</h1>")
 
 
+def cached_tareas(request):
+    # condition() pide el ETag, la fecha y después el cuerpo: la entrada se busca
+    # en el cache una sola vez por petición (LocMem la deserializa en cada get)
+    if not hasattr(request, 'tareas_entry'):
+        request.tareas_entry = tareas_entry()
+    return request.tareas_entry
+
+
+# condition() responde 304 si el cliente ya tiene la versión actual
+# (If-None-Match / If-Modified-Since) sin generar el cuerpo otra vez
+@condition(
+    etag_func=lambda request: cached_tareas(request)['etag'],
+    last_modified_func=lambda request: cached_tareas(request)['last_modified'],
+)
 def api_tareas(request):
-    tareas = Tarea.objects.all().values('title', 'completed')
-    return JsonResponse({"tareas": list(tareas)})
\ No newline at end of file
+    return HttpResponse(cached_tareas(request)['body'], content_type='application/json')
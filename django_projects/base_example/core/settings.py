@@ -116,3 +116,16 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# locmem vive en la memoria de cada proceso; con varios workers usar FileBasedCache
+# ('django.core.cache.backends.filebased.FileBasedCache', LOCATION en disco)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'base-example',
+    }
+}
@@ -0,0 +1,64 @@
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.http import JsonResponse
+from django.test import RequestFactory
+
+from mates.models import Mates
+from mates.views import api_mates
+
+
+class Command(BaseCommand):
+    help = 'Carga N mates en la base local, mide api_mates (lista completa, páginas y streaming) y los borra'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--page-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        # Los mates que se insertan para medir se borran al terminar: la base queda como estaba
+        last_pk = Mates.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        try:
+            rows = options['rows']
+            missing = rows - Mates.objects.count()
+            if missing > 0:
+                self.stdout.write(f'Insertando {missing:,} mates...')
+                batch = 10_000
+                for start in range(0, missing, batch):
+                    Mates.objects.bulk_create(
+                        [Mates(title=f'mate {start + i}') for i in range(min(batch, missing - start))]
+                    )
+            self.run(options)
+        finally:
+            # Un DELETE directo: .delete() del queryset cargaría los ids en memoria
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {Mates._meta.db_table} WHERE id > %s', [last_pk])
+
+    def run(self, options):
+        factory = RequestFactory()
+
+        def old_view(request):
+            # La vista original: toda la tabla en una sola respuesta
+            return JsonResponse({"response": list(Mates.objects.all().values())})
+
+        def measure(name, view, params=None):
+            request = factory.get('/api/mates', params or {})
+            tracemalloc.start()
+            start = time.perf_counter()
+            response = view(request)
+            size = sum(len(part) for part in response) if response.streaming else len(response.content)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self.stdout.write(f'{name:<34} {elapsed * 1000:10.1f} ms  {size / 1e6:8.1f} MB  '
+                              f'memoria pico {peak / 1e6:8.1f} MB')
+
+        page = {'page_size': options['page_size']}
+        last_id = Mates.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        measure('lista completa (vista original)', old_view)
+        measure('primera página', api_mates, page)
+        measure('página desde el final (cursor)', api_mates, {**page, 'cursor': last_id - options['page_size']})
+        measure('página solo title', api_mates, {**page, 'fields': 'title'})
+        measure('exportación streaming', api_mates, {'stream': '1'})
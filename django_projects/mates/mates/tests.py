@@ -1,3 +1,63 @@
+import json
+
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Mates
+
+
+class ApiMatesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.mates = Mates.objects.bulk_create([Mates(title=f'mate {i}') for i in range(25)])
+        cls.ids = list(Mates.objects.order_by('pk').values_list('pk', flat=True))
+
+    def get(self, **params):
+        response = self.client.get(reverse('api_mates'), params)
+        return response, json.loads(b''.join(response.streaming_content) if response.streaming else response.content)
+
+    def test_pages_follow_cursor_without_gaps_or_repeats(self):
+        seen = []
+        params = {'page_size': 10}
+        while True:
+            response, data = self.get(**params)
+            self.assertEqual(response.status_code, 200)
+            seen.extend(mate['id'] for mate in data['response'])
+            if not data['has_more']:
+                self.assertIsNone(data['next_cursor'])
+                break
+            self.assertEqual(data['next_cursor'], seen[-1])
+            params['cursor'] = data['next_cursor']
+        self.assertEqual(seen, self.ids)
+
+    def test_page_starts_after_cursor(self):
+        _, data = self.get(cursor=self.ids[4], page_size=3)
+        self.assertEqual([mate['id'] for mate in data['response']], self.ids[5:8])
+        self.assertTrue(data['has_more'])
+
+    def test_last_page_exactly_full_has_no_more(self):
+        _, data = self.get(cursor=self.ids[14], page_size=10)
+        self.assertEqual(len(data['response']), 10)
+        self.assertFalse(data['has_more'])
+        self.assertIsNone(data['next_cursor'])
+
+    def test_fields_without_id_still_paginates(self):
+        _, data = self.get(page_size=2, fields='title')
+        self.assertEqual(data['response'], [{'title': 'mate 0'}, {'title': 'mate 1'}])
+        self.assertEqual(data['next_cursor'], self.ids[1])
+
+    def test_invalid_parameters(self):
+        for params in ({'cursor': 'x'}, {'page_size': '0'}, {'fields': 'id,precio'}):
+            response, _ = self.get(**params)
+            self.assertEqual(response.status_code, 400, params)
+
+    def test_page_size_is_capped(self):
+        Mates.objects.bulk_create([Mates(title='extra') for _ in range(1_000)])
+        _, data = self.get(page_size=5_000)
+        self.assertEqual(len(data['response']), 1_000)
+        self.assertTrue(data['has_more'])
 
-# Create your tests here.
+    def test_stream_exports_whole_table(self):
+        response, data = self.get(stream='1')
+        self.assertTrue(response.streaming)
+        self.assertEqual([mate['id'] for mate in data['response']], self.ids)
@@ -1,12 +1,75 @@
+import json
+
 from django.shortcuts import render
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
 from .models import Mates
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+EXPORT_CHUNK_SIZE = 2000
+FIELDS = ('id', 'title')
+
 # Create your views here.
 def api_mates(request):
-    # mates = Mates.objects.all().values
-    tareas = Mates.objects.all().values()
+    """
+    Lista de mates paginada por cursor (keyset sobre la clave primaria).
+
+    Parámetros GET:
+    cursor: id del último mate recibido (la página empieza después de él)
+    page_size: cantidad de mates por página (máximo MAX_PAGE_SIZE)
+    fields: columnas a devolver separadas por coma (por defecto todas)
+    stream=1: exporta toda la tabla como un array JSON generado de a poco
+    """
+    try:
+        cursor = int(request.GET.get('cursor', 0))
+        page_size = min(int(request.GET.get('page_size', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+    except ValueError:
+        return JsonResponse({"error": "cursor and page_size must be integers"}, status=400)
+    if page_size < 1:
+        return JsonResponse({"error": "page_size must be positive"}, status=400)
+
+    fields = tuple(request.GET['fields'].split(',')) if request.GET.get('fields') else FIELDS
+    if not set(fields) <= set(FIELDS):
+        return JsonResponse({"error": f"fields must be a subset of {', '.join(FIELDS)}"}, status=400)
+
+    if request.GET.get('stream') == '1':
+        return StreamingHttpResponse(stream_mates(fields), content_type='application/json')
+
+    # values() solo pide esas columnas; filtrar por pk > cursor usa el índice de la
+    # clave primaria, así la página N cuesta lo mismo que la primera (sin OFFSET)
+    columns = fields if 'id' in fields else ('id',) + fields
+    mates = list(
+        Mates.objects.filter(pk__gt=cursor).order_by('pk').values(*columns)[:page_size + 1]
+    )
+    has_more = len(mates) > page_size
+    mates = mates[:page_size]
+    next_cursor = mates[-1]['id'] if has_more else None
+    if 'id' not in fields:
+        for mate in mates:
+            del mate['id']
 
     return JsonResponse({
-         "response": list(tareas)
+         "response": mates,
+         "next_cursor": next_cursor,
+         "has_more": has_more,
     })
+
+
+def stream_mates(fields):
+    # Genera el array JSON por partes: .iterator() trae las filas por bloques
+    # sin cargar toda la tabla en memoria ni en el cache del queryset
+    yield '{"response": ['
+    rows = Mates.objects.order_by('pk').values(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    chunk = []
+    separator = ''
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == EXPORT_CHUNK_SIZE:
+            # Un solo json.dumps por bloque; [1:-1] quita los corchetes de la lista
+            yield separator + json.dumps(chunk, cls=DjangoJSONEncoder)[1:-1]
+            separator = ','
+            chunk = []
+    if chunk:
+        yield separator + json.dumps(chunk, cls=DjangoJSONEncoder)[1:-1]
+    yield ']}'
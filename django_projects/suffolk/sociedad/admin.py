@@ -1,12 +1,38 @@
 from django.contrib import admin
+from . import search
 from .models import Persona, Article
 
+
+class SexoFilter(admin.SimpleListFilter):
+    # Opciones fijas: a diferencia de list_filter = ('sexo',) no hace un SELECT DISTINCT por página
+    title = 'sexo'
+    parameter_name = 'sexo'
+
+    def lookups(self, request, model_admin):
+        return [('M', 'Masculino'), ('F', 'Femenino')]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(sexo=self.value())
+        return queryset
+
+
 class PersonaAdmin(admin.ModelAdmin):
     list_display = ('nombre', 'apellido', 'dni', 'sexo')
-    list_filter = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
-    search_fields = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
-    ordering = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
-    
+    # Filtros sin consultas extra: el de fechas también tiene opciones fijas
+    list_filter = (SexoFilter, 'nacimiento')
+    # Solo se usan si no hay índice de texto completo (motores distintos de SQLite)
+    search_fields = ('nombre', 'apellido', '=dni')
+    # Cubierto por el índice (apellido, nombre); con el id al final Django no agrega otro orden
+    ordering = ('apellido', 'nombre', 'id')
+    # Evita un COUNT(*) de toda la tabla en cada búsqueda
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        if not search.is_available():
+            return super().get_search_results(request, queryset, search_term)
+        return search.search(queryset, search_term), False
+
 
 # Register your models here.
 admin.site.register(Persona, PersonaAdmin)
@@ -3,3 +3,7 @@ from django.apps import AppConfig
 
 class SociedadConfig(AppConfig):
     name = 'sociedad'
+
+    def ready(self):
+        # Registra los receivers que mantienen al día el índice de búsqueda de Persona
+        from . import signals  # noqa: F401
@@ -0,0 +1,27 @@
+import time
+
+from django.core.cache import cache
+from django.db.models import Max
+
+from .models import Article
+
+# Versión del cache del listado del blog (ver blog_list y blog.html)
+
+BLOG_DELETED_KEY = 'blog_deleted'  # Marca de la última baja de un artículo
+
+
+def blog_cache_version():
+    """
+    Cambia con cada alta, edición o baja de un artículo.
+
+    Max('actualizado') lee un extremo del índice; las bajas no lo mueven, por eso se
+    suma la marca de borrado. Si el cache la descartó se crea una nueva, nunca usada:
+    en el peor caso se vuelve a renderizar, pero no se sirve una página vieja.
+    """
+    ultimo = Article.objects.aggregate(ultimo=Max('actualizado'))['ultimo']
+    deleted = cache.get_or_set(BLOG_DELETED_KEY, time.time_ns, None)
+    return f'{ultimo:%Y%m%d%H%M%S%f}-{deleted}' if ultimo else f'vacio-{deleted}'
+
+
+def mark_article_deleted():
+    cache.set(BLOG_DELETED_KEY, time.time_ns(), None)
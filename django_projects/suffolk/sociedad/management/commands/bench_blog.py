@@ -0,0 +1,84 @@
+import time
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.template import Context, Template
+from django.test import RequestFactory
+
+from sociedad.blog_cache import mark_article_deleted
+from sociedad.models import Article
+from sociedad.views import blog_list
+
+# El loop del blog.html original: todos los artículos con el contenido completo
+ORIGINAL_TEMPLATE = Template(
+    '{% for article in articles %}<h2>{{ article.titulo }}</h2>'
+    '<p>{{ article.fecha|date:"d M, Y" }}</p>{{ article.contenido|linebreaks }}{% endfor %}'
+)
+
+
+class Command(BaseCommand):
+    help = 'Mide consulta y render del listado del blog (original contra paginado con cache)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--articles', type=int, default=100_000)
+        parser.add_argument('--requests', type=int, default=200)
+
+    def handle(self, *args, **options):
+        # Los artículos que se insertan para medir se borran al terminar: la base queda como estaba
+        last_pk = Article.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        try:
+            missing = options['articles'] - Article.objects.count()
+            if missing > 0:
+                body = '\n'.join(['Texto de prueba sobre la raza Suffolk. ' * 10] * 5)
+                Article.objects.bulk_create(
+                    (Article(titulo=f'Artículo {i}', contenido=body) for i in range(missing)),
+                    batch_size=5_000,
+                )
+            self.run(options)
+        finally:
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {Article._meta.db_table} WHERE id > %s', [last_pk])
+            mark_article_deleted()  # El DELETE directo no dispara post_delete
+
+    def run(self, options):
+        total = Article.objects.count()
+        self.stdout.write(f'{total:,} artículos')
+
+        start = time.perf_counter()
+        articles = list(Article.objects.all().order_by('-fecha'))
+        query = time.perf_counter() - start
+        start = time.perf_counter()
+        html = ORIGINAL_TEMPLATE.render(Context({'articles': articles}))
+        render = time.perf_counter() - start
+        self.stdout.write(
+            f'{"original (todo en una página)":<32} consulta {query * 1000:9.1f} ms  '
+            f'render {render * 1000:9.1f} ms  ({len(html) / 1e6:.1f} MB de HTML)'
+        )
+        del articles, html
+
+        factory = RequestFactory()
+        last_page = (total - 1) // 20 + 1
+
+        def measure(name, page, warm):
+            request = factory.get('/blog/', {'page': page})
+            requests = options['requests']
+            start = time.perf_counter()
+            for _ in range(requests):
+                if not warm:
+                    cache.clear()
+                response = blog_list(request)
+            elapsed = (time.perf_counter() - start) / requests
+            self.stdout.write(
+                f'{name:<32} {elapsed * 1000:9.2f} ms/petición  ({len(response.content) / 1e3:.0f} KB)'
+            )
+
+        measure('paginado, página 1, sin cache', 1, warm=False)
+        measure('paginado, página 1, con cache', 1, warm=True)
+        measure(f'paginado, página {last_page}, sin cache', last_page, warm=False)
+        measure(f'paginado, página {last_page}, con cache', last_page, warm=True)
+
+        with connection.cursor() as cursor:
+            sql, params = Article.objects.order_by('-fecha', '-id').values('id')[:20].query.sql_with_params()
+            cursor.execute('EXPLAIN QUERY PLAN ' + sql, params)
+            self.stdout.write('plan: ' + '; '.join(str(row[-1]) for row in cursor.fetchall()))
@@ -0,0 +1,116 @@
+import csv
+import json
+import os
+import random
+import tempfile
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from sociedad import search
+from sociedad.models import Persona
+from sociedad.personas_io import FIELDS, export_personas, import_personas, read_rows, validate_row
+
+NOMBRES = ['Juan', 'María', 'José', 'Ana', 'Carlos', 'Lucía', 'Pedro', 'Sofía']
+APELLIDOS = ['González', 'Rodríguez', 'Pérez', 'Fernández', 'López', 'Martínez', 'Silva', 'Díaz']
+
+
+def generate_personas(path, rows, invalid_ratio=0.01, seed=42):
+    """Escribe un CSV (o JSONL según la extensión) con personas aleatorias y algunas filas inválidas"""
+    rng = random.Random(seed)
+    jsonl = path.endswith('.jsonl')
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = None if jsonl else csv.DictWriter(f, fieldnames=FIELDS)
+        if writer:
+            writer.writeheader()
+        for i in range(rows):
+            nombre = rng.choice(NOMBRES)
+            row = {
+                'dni': str(10_000_000 + i),
+                'nombre': nombre,
+                'apellido': rng.choice(APELLIDOS),
+                'sexo': rng.choice('MF'),
+                'nacimiento': f'{rng.randint(1940, 2010)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}',
+                'nacionalidad': 'uruguaya',
+                'direccion': f'Calle {rng.randint(1, 3000)}',
+                'telefono': f'09{rng.randint(1_000_000, 9_999_999)}',
+                'correo': f'{nombre.lower()}{i}@example.com',
+            }
+            if rng.random() < invalid_ratio:
+                row['nacimiento'] = 'desconocida'
+            if jsonl:
+                f.write(json.dumps(row, ensure_ascii=False) + '\n')
+            else:
+                writer.writerow(row)
+
+
+def clear_personas():
+    # Un DELETE directo: Persona.objects.all().delete() dispararía post_delete fila por fila
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {Persona._meta.db_table}')
+    search.rebuild_index()
+
+
+class Command(BaseCommand):
+    help = 'Compara la importación masiva de personas con save() fila a fila (necesita la tabla vacía)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=200_000)
+        parser.add_argument('--save-rows', type=int, default=5_000, help='Filas a medir con save()')
+
+    def handle(self, *args, **options):
+        # Borra todo lo que inserta al terminar: correrlo sobre una copia de la base
+        if Persona.objects.exists():
+            raise CommandError('Persona table must be empty; run the benchmark on a copy of the database')
+
+        rows = options['rows']
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'personas.csv')
+            jsonl_path = os.path.join(tmp, 'personas.jsonl')
+            generate_personas(csv_path, rows)
+            generate_personas(jsonl_path, rows)
+            self.stdout.write(f'{rows:,} filas generadas ({os.path.getsize(csv_path) / 1e6:.1f} MB de CSV)')
+
+            try:
+                self.run(csv_path, jsonl_path, tmp, options['save_rows'])
+            finally:
+                clear_personas()
+
+    def report(self, name, count, seconds):
+        self.stdout.write(f'{name:<34} {count:>10,} filas {seconds:8.2f} s {count / seconds:>12,.0f} filas/s')
+
+    def run(self, csv_path, jsonl_path, tmp, save_rows):
+        # La forma original: un save() (y un commit) por persona
+        start = time.perf_counter()
+        saved = 0
+        for _, row in read_rows(csv_path):
+            if saved == save_rows:
+                break
+            try:
+                Persona(**validate_row(row)).save()
+            except ValueError:
+                continue
+            saved += 1
+        self.report('save() fila a fila', saved, time.perf_counter() - start)
+        clear_personas()
+
+        for batch_size in (100, 500, 2_000, 10_000):
+            stats = import_personas(csv_path, batch_size=batch_size)
+            self.report(f'bulk_create, lotes de {batch_size:,}', stats['created'], stats['seconds'])
+            clear_personas()
+
+        stats = import_personas(jsonl_path)
+        self.report('bulk_create desde JSONL', stats['created'], stats['seconds'])
+        self.stdout.write(f"  filas inválidas descartadas: {stats['invalid']:,}")
+
+        # Mismo archivo otra vez con --upsert: todas las filas actualizan a una persona existente
+        stats = import_personas(jsonl_path, upsert=True)
+        self.report('upsert por dni (todo actualiza)', stats['updated'], stats['seconds'])
+        self.stdout.write(f'  personas en la tabla: {Persona.objects.count():,}')
+
+        export_path = os.path.join(tmp, 'export.csv')
+        start = time.perf_counter()
+        with open(export_path, 'w', newline='', encoding='utf-8') as f:
+            count = export_personas(f)
+        self.report('exportación a CSV', count, time.perf_counter() - start)
@@ -0,0 +1,115 @@
+import os
+import tempfile
+import time
+
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import connection, reset_queries
+from django.test import RequestFactory, override_settings
+
+from sociedad import search
+from sociedad.admin import PersonaAdmin
+from sociedad.management.commands.bench_personas import generate_personas
+from sociedad.models import Persona
+from sociedad.personas_io import import_personas
+
+SEARCHES = ['', 'gonz', 'maria lopez', '10000500', 'example']
+FILTERS = [{'sexo': 'F'}]
+
+
+class OriginalPersonaAdmin(admin.ModelAdmin):
+    # La configuración anterior de PersonaAdmin
+    list_display = ('nombre', 'apellido', 'dni', 'sexo')
+    list_filter = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
+    search_fields = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
+    ordering = ('nombre', 'apellido', 'dni', 'sexo', 'nacimiento', 'nacionalidad', 'direccion', 'telefono', 'correo')
+
+
+ADMINS = [
+    ('original', OriginalPersonaAdmin(Persona, admin.site)),
+    ('indexado', PersonaAdmin(Persona, admin.site)),
+]
+
+
+def page_queries(model_admin, params):
+    """Las consultas que hace la lista del admin para una página, sin renderizar el template"""
+    queryset = Persona.objects.all()
+    if params.get('sexo'):
+        queryset = queryset.filter(sexo=params['sexo'])
+    if params.get('q'):
+        queryset, _ = model_admin.get_search_results(None, queryset, params['q'])
+    ordering = list(model_admin.ordering)
+    if 'id' not in ordering:
+        ordering.append('-pk')  # Lo que agrega ChangeList para que el orden sea determinista
+    queryset.count()
+    list(queryset.order_by(*ordering)[:100])
+    # Un filtro de la barra lateral por cada campo de list_filter que no tiene opciones fijas
+    for field in model_admin.list_filter:
+        if isinstance(field, str) and field != 'nacimiento':
+            list(Persona.objects.values_list(field, flat=True).distinct().order_by(field))
+
+
+class Command(BaseCommand):
+    help = 'Carga N personas y mide la lista del admin de Persona (original contra índices y FTS5)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1_000_000)
+        parser.add_argument('--repeat', type=int, default=3)
+
+    def handle(self, *args, **options):
+        # Las personas que se insertan para medir se borran al terminar: la base queda como estaba
+        last_pk = Persona.objects.order_by('-pk').values_list('pk', flat=True).first() or 0
+        try:
+            missing = options['rows'] - Persona.objects.count()
+            if missing > 0:
+                self.stdout.write(f'Insertando {missing:,} personas...')
+                with tempfile.TemporaryDirectory() as tmp:
+                    path = os.path.join(tmp, 'personas.csv')
+                    generate_personas(path, missing, invalid_ratio=0)
+                    stats = import_personas(path, batch_size=10_000)
+                self.stdout.write(f"  {stats['seconds']:.0f} s ({stats['created'] / stats['seconds']:,.0f} filas/s)")
+            self.run(options)
+        finally:
+            # DELETE directo (sin post_delete fila por fila): el índice se limpia igual, por rowid
+            with connection.cursor() as cursor:
+                cursor.execute(f'DELETE FROM {Persona._meta.db_table} WHERE id > %s', [last_pk])
+                if search.is_available():
+                    cursor.execute(f'DELETE FROM {search.FTS_TABLE} WHERE rowid > %s', [last_pk])
+
+    def run(self, options):
+        self.stdout.write(f'{Persona.objects.count():,} personas')
+
+        self.stdout.write('\nConsultas de una página del admin (búsqueda, COUNT, 100 filas y filtros):')
+        for params in [{'q': q} if q else {} for q in SEARCHES] + FILTERS:
+            label = ' '.join(f'{key}={value!r}' for key, value in params.items()) or 'sin búsqueda'
+            for name, model_admin in ADMINS:
+                seconds = self.best(lambda: page_queries(model_admin, params), options['repeat'])
+                self.stdout.write(f'  {label:<20} {name:<9} {seconds * 1000:10.1f} ms')
+
+        # La página completa (con el template) solo con el admin nuevo: la original arma
+        # un filtro con cada valor distinto de 9 columnas y con 1M de filas no termina en minutos
+        self.stdout.write('\nPágina completa del admin indexado:')
+        factory = RequestFactory()
+        user = User(username='bench', is_staff=True, is_superuser=True, is_active=True)
+        model_admin = ADMINS[1][1]
+        with override_settings(DEBUG=True):
+            for params in [{'q': q} if q else {} for q in SEARCHES] + FILTERS:
+                label = ' '.join(f'{key}={value!r}' for key, value in params.items()) or 'sin búsqueda'
+                request = factory.get('/admin/sociedad/persona/', params)
+                request.user = user
+
+                def changelist():
+                    reset_queries()
+                    return model_admin.changelist_view(request).render()
+
+                seconds = self.best(changelist, options['repeat'])
+                self.stdout.write(f'  {label:<20} {seconds * 1000:10.1f} ms  {len(connection.queries)} consultas')
+
+    def best(self, func, repeat):
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+        return min(times)
@@ -0,0 +1,21 @@
+import sys
+
+from django.core.management.base import BaseCommand
+
+from sociedad.personas_io import DEFAULT_BATCH_SIZE, export_personas
+
+
+class Command(BaseCommand):
+    help = 'Exporta todas las personas a CSV, leyendo la tabla por bloques'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-', help="Archivo de salida ('-' para stdout)")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        if options['path'] == '-':
+            export_personas(sys.stdout, options['chunk_size'])
+            return
+        with open(options['path'], 'w', newline='', encoding='utf-8') as f:
+            count = export_personas(f, options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f"{count:,} personas exportadas a {options['path']}"))
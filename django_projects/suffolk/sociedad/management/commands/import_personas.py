@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from sociedad.personas_io import DEFAULT_BATCH_SIZE, import_personas
+
+MAX_ERRORS_SHOWN = 20
+
+
+class Command(BaseCommand):
+    help = 'Importa personas desde un CSV (con encabezado) o JSONL usando bulk_create por lotes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Por defecto según la extensión')
+        parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+        parser.add_argument('--upsert', action='store_true', help='Actualiza las personas con un dni ya cargado')
+        parser.add_argument('--progress-every', type=int, default=100_000, help='Filas entre reportes (0 los desactiva)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size must be positive')
+        every = options['progress_every']
+        next_report = every
+        shown_errors = 0
+
+        def on_error(line_number, reason):
+            nonlocal shown_errors
+            shown_errors += 1
+            if shown_errors <= MAX_ERRORS_SHOWN:
+                self.stderr.write(f'línea {line_number}: {reason}')
+
+        def on_progress(stats):
+            nonlocal next_report
+            if every and stats['read'] >= next_report:
+                next_report += every
+                self.stdout.write(
+                    f"{stats['read']:>12,} filas  {stats['read'] / stats['seconds']:>10,.0f} filas/s"
+                )
+
+        try:
+            stats = import_personas(
+                options['path'], options['format'], options['batch_size'], options['upsert'],
+                on_error=on_error, on_progress=on_progress,
+            )
+        except FileNotFoundError as e:
+            raise CommandError(str(e))
+
+        if stats['invalid'] > MAX_ERRORS_SHOWN:
+            self.stderr.write(f"... y {stats['invalid'] - MAX_ERRORS_SHOWN:,} filas inválidas más")
+        rate = stats['read'] / stats['seconds'] if stats['seconds'] else 0
+        self.stdout.write(self.style.SUCCESS(
+            f"{stats['read']:,} filas leídas: {stats['created']:,} creadas, {stats['updated']:,} actualizadas, "
+            f"{stats['invalid']:,} inválidas en {stats['seconds']:.1f} s ({rate:,.0f} filas/s)"
+        ))
@@ -0,0 +1,16 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from sociedad import search
+
+
+class Command(BaseCommand):
+    help = 'Reconstruye el índice de texto completo de Persona (después de update() o SQL directo)'
+
+    def handle(self, *args, **options):
+        if not search.is_available():
+            raise CommandError('The full-text index requires SQLite (FTS5)')
+        start = time.perf_counter()
+        search.rebuild_index()
+        self.stdout.write(self.style.SUCCESS(f'Índice reconstruido en {time.perf_counter() - start:.1f} s'))
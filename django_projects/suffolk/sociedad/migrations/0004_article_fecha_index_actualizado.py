@@ -0,0 +1,23 @@
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sociedad', '0003_article'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='article',
+            name='fecha',
+            field=models.DateField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='article',
+            name='actualizado',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+    ]
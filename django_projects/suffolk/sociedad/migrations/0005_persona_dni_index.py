@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sociedad', '0004_article_fecha_index_actualizado'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='persona',
+            name='dni',
+            field=models.CharField(blank=True, db_index=True, max_length=10, null=True),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations, models
+
+# Tabla virtual FTS5 con las columnas de texto de Persona (ver sociedad/search.py).
+# Solo existe en SQLite; en otros motores la migración no hace nada.
+
+FTS_TABLE = 'sociedad_persona_fts'
+FTS_FIELDS = 'nombre, apellido, dni, nacionalidad, direccion, telefono, correo'
+
+
+def create_fts(apps, schema_editor):
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+    schema_editor.execute(
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({FTS_FIELDS}, "
+        "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+    )
+    schema_editor.execute(
+        f"INSERT INTO {FTS_TABLE} (rowid, {FTS_FIELDS}) SELECT id, {FTS_FIELDS} FROM sociedad_persona"
+    )
+
+
+def drop_fts(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute(f'DROP TABLE IF EXISTS {FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sociedad', '0005_persona_dni_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='persona',
+            name='nombre',
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='persona',
+            index=models.Index(fields=['apellido', 'nombre'], name='persona_apellido_nombre_idx'),
+        ),
+        migrations.RunPython(create_fts, drop_fts),
+    ]
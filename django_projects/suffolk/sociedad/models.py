@@ -3,9 +3,10 @@ from django.db import models
 # Create your models here.
 class Persona(models.Model):
     id = models.AutoField(primary_key=True)
-    nombre = models.CharField(max_length=100)
+    nombre = models.CharField(max_length=100, db_index=True)
     apellido = models.CharField(max_length=100, null=True, blank=True)
-    dni = models.CharField(max_length=10, null=True, blank=True)
+    # db_index: la importación con --upsert busca cada lote de personas por dni
+    dni = models.CharField(max_length=10, null=True, blank=True, db_index=True)
     sexo = models.CharField(max_length=1, null=True, blank=True)
     nacimiento = models.DateField(null=True, blank=True)
     nacionalidad = models.CharField(max_length=100, null=True, blank=True)
@@ -13,6 +14,12 @@ class Persona(models.Model):
     telefono = models.CharField(max_length=100, null=True, blank=True)
     correo = models.CharField(max_length=100, null=True, blank=True)
     
+    class Meta:
+        indexes = [
+            # El admin ordena por (apellido, nombre, id): el índice entrega las filas ya ordenadas
+            models.Index(fields=['apellido', 'nombre'], name='persona_apellido_nombre_idx'),
+        ]
+
     def __str__(self):
         return self.nombre
 
@@ -20,7 +27,10 @@ class Article(models.Model):
     id = models.AutoField(primary_key=True)
     titulo = models.CharField(max_length=100)
     contenido = models.TextField()
-    fecha = models.DateField(auto_now_add=True)
+    # db_index: el listado del blog ordena por fecha; en SQLite el índice incluye el id
+    fecha = models.DateField(auto_now_add=True, db_index=True)
+    # Se actualiza en cada save(); el cache del listado usa el valor más reciente
+    actualizado = models.DateTimeField(auto_now=True, db_index=True)
 
     def __str__(self):
         return self.titulo
\ No newline at end of file
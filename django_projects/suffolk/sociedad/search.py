@@ -0,0 +1,88 @@
+import re
+
+from django.db import connection
+from django.db.models.expressions import RawSQL
+
+# Índice de texto completo de Persona sobre una tabla virtual FTS5 de SQLite.
+# La fila del índice usa como rowid el id de la persona; se mantiene al día con
+# las señales de signals.py y, en las cargas masivas, con index_personas().
+# La tabla (tokenizer sin acentos y prefijos) se crea en la migración 0006; en otros
+# motores no existe y el admin vuelve a la búsqueda de Django.
+
+FTS_TABLE = 'sociedad_persona_fts'
+FTS_FIELDS = ('nombre', 'apellido', 'dni', 'nacionalidad', 'direccion', 'telefono', 'correo')
+# Las consultas por id se parten en lotes de 500 (límite de parámetros de SQLite)
+IDS_PER_QUERY = 500
+
+TOKEN_RE = re.compile(r'\w+')
+
+
+def is_available():
+    return connection.vendor == 'sqlite'
+
+
+def _for_ids(sql, ids):
+    ids = list(ids)
+    with connection.cursor() as cursor:
+        for start in range(0, len(ids), IDS_PER_QUERY):
+            chunk = ids[start:start + IDS_PER_QUERY]
+            cursor.execute(sql.format(placeholders=', '.join(['%s'] * len(chunk))), chunk)
+
+
+def remove_personas(ids):
+    if is_available():
+        _for_ids(f'DELETE FROM {FTS_TABLE} WHERE rowid IN ({{placeholders}})', ids)
+
+
+def index_personas(ids):
+    """(Re)indexa las personas con esos ids copiando sus columnas desde la tabla de Persona"""
+    if not is_available():
+        return
+    from .models import Persona
+    remove_personas(ids)
+    _for_ids(
+        f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_FIELDS)}) "
+        f"SELECT id, {', '.join(FTS_FIELDS)} FROM {Persona._meta.db_table} WHERE id IN ({{placeholders}})",
+        ids,
+    )
+
+
+def rebuild_index():
+    """Vacía el índice y lo vuelve a llenar con toda la tabla (tras cambios que no disparan señales)"""
+    if not is_available():
+        return
+    from .models import Persona
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(
+            f"INSERT INTO {FTS_TABLE} (rowid, {', '.join(FTS_FIELDS)}) "
+            f"SELECT id, {', '.join(FTS_FIELDS)} FROM {Persona._meta.db_table}"
+        )
+        cursor.execute(f"INSERT INTO {FTS_TABLE} ({FTS_TABLE}) VALUES ('optimize')")
+
+
+def build_query(text):
+    """
+    Convierte lo que se escribió en el buscador en una consulta MATCH de FTS5.
+
+    Cada palabra se busca como prefijo y todas tienen que aparecer:
+    'gonz juan' -> '"gonz"* AND "juan"*'
+
+    Retorna:
+    str o None si el texto no tiene palabras
+    """
+    tokens = TOKEN_RE.findall(text)
+    if not tokens:
+        return None
+    # Entre comillas, las palabras reservadas de FTS5 (AND, OR, NEAR...) se tratan como texto
+    return ' AND '.join(f'"{token}"*' for token in tokens)
+
+
+def search(queryset, text):
+    """Filtra un queryset de Persona con el índice de texto completo"""
+    query = build_query(text)
+    if query is None:
+        return queryset
+    return queryset.filter(
+        pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (query,))
+    )
@@ -0,0 +1,26 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from . import search
+from .blog_cache import mark_article_deleted
+from .models import Article, Persona
+
+# Ojo: bulk_create(), QuerySet.update() y las consultas SQL directas no disparan
+# estas señales; después de usarlos hay que llamar a search.index_personas(ids)
+# o search.rebuild_index() (como hace personas_io en las importaciones).
+
+
+@receiver(post_save, sender=Persona)
+def persona_saved(sender, instance, **kwargs):
+    search.index_personas([instance.pk])
+
+
+@receiver(post_delete, sender=Persona)
+def persona_deleted(sender, instance, **kwargs):
+    search.remove_personas([instance.pk])
+
+
+@receiver(post_delete, sender=Article)
+def article_deleted(sender, instance, **kwargs):
+    # Una baja no cambia Max('actualizado'): la nueva marca invalida el cache del blog
+    mark_article_deleted()
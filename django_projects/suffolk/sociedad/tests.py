@@ -1,3 +1,217 @@
+import csv
+import io
+import os
+import tempfile
+from datetime import date
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.urls import reverse
+
+from . import search
+from .admin import PersonaAdmin
+from .models import Article, Persona
+from .personas_io import FIELDS, export_personas, import_personas
+from .views import ARTICLES_PER_PAGE, EXCERPT_LENGTH
+
+
+class BlogListTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('blog_list')
+
+    def create_articles(self, count):
+        return [Article.objects.create(titulo=f'Artículo {i}', contenido=f'Texto {i}') for i in range(count)]
+
+    def test_pages_are_newest_first_without_repeats(self):
+        self.create_articles(ARTICLES_PER_PAGE + 5)
+        first = self.client.get(self.url).context['page']
+        second = self.client.get(self.url, {'page': 2}).context['page']
+        titles = [article.titulo for article in list(first) + list(second)]
+        self.assertEqual(titles, [f'Artículo {i}' for i in reversed(range(ARTICLES_PER_PAGE + 5))])
+        self.assertEqual(first.paginator.num_pages, 2)
+
+    def test_ellipsis_only_when_content_is_longer_than_excerpt(self):
+        Article.objects.create(titulo='Justo', contenido='a' * EXCERPT_LENGTH)
+        Article.objects.create(titulo='Largo', contenido='b' * (EXCERPT_LENGTH + 1))
+        response = self.client.get(self.url)
+        truncado = {article.titulo: article.truncado for article in response.context['page']}
+        self.assertEqual(truncado, {'Justo': False, 'Largo': True})
+        self.assertContains(response, '…', count=1)
+        self.assertNotContains(response, 'b' * (EXCERPT_LENGTH + 1))
+
+    def test_cached_page_only_reads_cache_version(self):
+        self.create_articles(3)
+        self.client.get(self.url)
+        # Solo el Max('actualizado') de blog_cache_version: ni COUNT(*) ni las filas de la página
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+        self.assertContains(response, 'Artículo 2')
+
+    def test_edit_invalidates_cached_page(self):
+        article, = self.create_articles(1)
+        self.client.get(self.url)
+        article.titulo = 'Editado'
+        article.save()
+        self.assertContains(self.client.get(self.url), 'Editado')
+
+    def test_create_invalidates_cached_page(self):
+        self.create_articles(1)
+        self.client.get(self.url)
+        Article.objects.create(titulo='Nuevo', contenido='Texto')
+        response = self.client.get(self.url)
+        self.assertContains(response, 'Nuevo')
+        self.assertEqual(response.context['page'].paginator.count, 2)
+
+    def test_delete_invalidates_cached_page_and_count(self):
+        articles = self.create_articles(2)
+        self.client.get(self.url)
+        # El borrado del más viejo no cambia Max('actualizado'): lo invalida la señal post_delete
+        articles[0].delete()
+        response = self.client.get(self.url)
+        self.assertNotContains(response, 'Artículo 0')
+        self.assertEqual(response.context['page'].paginator.count, 1)
+
+
+class ImportPersonasTests(TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+
+    def write(self, name, content):
+        path = os.path.join(self.tmp, name)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def run_import(self, path, **kwargs):
+        errors = []
+        stats = import_personas(path, on_error=lambda line, reason: errors.append((line, reason)), **kwargs)
+        return stats, errors
+
+    def test_csv_import_normalizes_and_reports_invalid_rows(self):
+        path = self.write('personas.csv', (
+            'dni,nombre,apellido,sexo,nacimiento,correo\n'
+            '123,Ana,López,f,1990-05-01,ana@example.com\n'
+            '456,,Pérez,M,,\n'
+            '789,Juan,Silva,M,01/02/1980,\n'
+            'abc,Luis,Díaz,M,,\n'
+        ))
+        stats, errors = self.run_import(path, batch_size=2)
+        self.assertEqual((stats['read'], stats['created'], stats['invalid']), (4, 1, 3))
+        self.assertEqual([line for line, _ in errors], [3, 4, 5])
+        ana = Persona.objects.get()
+        self.assertEqual((ana.sexo, ana.nacimiento, ana.telefono), ('F', date(1990, 5, 1), None))
+
+    def test_malformed_jsonl_lines_are_invalid_rows(self):
+        path = self.write('personas.jsonl', (
+            '{"dni": "1", "nombre": "Ana"}\n'
+            '{"dni": "2", "nombre": \n'
+            '["no", "es", "objeto"]\n'
+            '\n'
+            '{"dni": "3", "nombre": "Juan"}\n'
+        ))
+        stats, errors = self.run_import(path)
+        self.assertEqual((stats['created'], stats['invalid']), (2, 2))
+        self.assertEqual([line for line, _ in errors], [2, 3])
+        self.assertTrue(errors[0][1].startswith('invalid JSON'))
+        self.assertEqual(sorted(Persona.objects.values_list('dni', flat=True)), ['1', '3'])
+
+    def test_upsert_updates_by_dni_and_last_row_wins(self):
+        Persona.objects.create(dni='1', nombre='Ana', apellido='Viejo')
+        path = self.write('personas.jsonl', (
+            '{"dni": "1", "nombre": "Ana", "apellido": "Nuevo"}\n'
+            '{"dni": "2", "nombre": "Juan", "apellido": "Primero"}\n'
+            '{"dni": "2", "nombre": "Juan", "apellido": "Segundo"}\n'
+            '{"nombre": "Sin dni"}\n'
+        ))
+        stats, _ = self.run_import(path, upsert=True)
+        self.assertEqual((stats['created'], stats['updated']), (2, 1))
+        self.assertEqual(
+            dict(Persona.objects.exclude(dni=None).values_list('dni', 'apellido')),
+            {'1': 'Nuevo', '2': 'Segundo'},
+        )
+        self.assertTrue(Persona.objects.filter(dni=None, nombre='Sin dni').exists())
+
+    def test_without_upsert_duplicates_are_inserted(self):
+        Persona.objects.create(dni='1', nombre='Ana')
+        path = self.write('personas.csv', 'dni,nombre\n1,Ana\n')
+        stats, _ = self.run_import(path)
+        self.assertEqual(stats['created'], 1)
+        self.assertEqual(Persona.objects.filter(dni='1').count(), 2)
+
+    def test_export_round_trips_through_import(self):
+        Persona.objects.create(dni='1', nombre='Ana', nacimiento=date(1990, 5, 1), correo='ana@example.com')
+        Persona.objects.create(nombre='Juan')
+        out = io.StringIO()
+        self.assertEqual(export_personas(out, chunk_size=1), 2)
+        rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+        self.assertEqual(list(rows[0]), list(FIELDS))
+        self.assertEqual((rows[0]['nacimiento'], rows[1]['nombre']), ('1990-05-01', 'Juan'))
+
+        Persona.objects.all().delete()
+        stats, _ = self.run_import(self.write('export.csv', out.getvalue()))
+        self.assertEqual((stats['created'], stats['invalid']), (2, 0))
+        self.assertEqual(Persona.objects.get(dni='1').nacimiento, date(1990, 5, 1))
+
+
+class PersonaSearchTests(TestCase):
+    def setUp(self):
+        self.ana = Persona.objects.create(nombre='Ana', apellido='González', dni='12345678', correo='ana@example.com')
+        self.juan = Persona.objects.create(nombre='Juan', apellido='Pérez', dni='87654321')
+
+    def found(self, text):
+        return set(search.search(Persona.objects.all(), text).values_list('nombre', flat=True))
+
+    def test_build_query(self):
+        self.assertEqual(search.build_query('gonz juan'), '"gonz"* AND "juan"*')
+        self.assertEqual(search.build_query('AND or'), '"AND"* AND "or"*')
+        self.assertIsNone(search.build_query(' - , '))
+
+    def test_prefixes_accents_and_all_words(self):
+        self.assertEqual(self.found('gonz'), {'Ana'})
+        self.assertEqual(self.found('gonzalez'), {'Ana'})
+        self.assertEqual(self.found('PEREZ ju'), {'Juan'})
+        self.assertEqual(self.found('ana perez'), set())
+        self.assertEqual(self.found('8765'), {'Juan'})
+        self.assertEqual(self.found('example'), {'Ana'})
+        self.assertEqual(self.found('  '), {'Ana', 'Juan'})
+
+    def test_signals_keep_index_current(self):
+        self.ana.apellido = 'Silva'
+        self.ana.save()
+        self.assertEqual(self.found('gonz'), set())
+        self.assertEqual(self.found('silva'), {'Ana'})
+        self.juan.delete()
+        self.assertEqual(self.found('juan'), set())
+
+    def test_bulk_changes_need_rebuild(self):
+        Persona.objects.filter(pk=self.juan.pk).update(apellido='Díaz')
+        self.assertEqual(self.found('diaz'), set())
+        search.rebuild_index()
+        self.assertEqual(self.found('diaz'), {'Juan'})
+
+    def test_import_indexes_created_and_updated_rows(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'personas.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write('dni,nombre,apellido\n12345678,Ana,Rodríguez\n555,Lucía,Fernández\n')
+        import_personas(path, upsert=True)
+        self.assertEqual(self.found('rodriguez'), {'Ana'})
+        self.assertEqual(self.found('gonz'), set())
+        self.assertEqual(self.found('fern'), {'Lucía'})
+
+    def test_admin_search_uses_index(self):
+        model_admin = PersonaAdmin(Persona, admin.site)
+        queryset, may_have_duplicates = model_admin.get_search_results(None, Persona.objects.all(), 'gonz')
+        self.assertFalse(may_have_duplicates)
+        self.assertIn(search.FTS_TABLE, str(queryset.query))
+        self.assertEqual(list(queryset), [self.ana])
 
-# Create your tests here.
+    def test_index_table_exists(self):
+        self.assertTrue(search.is_available())
+        self.assertIn(search.FTS_TABLE, connection.introspection.table_names())
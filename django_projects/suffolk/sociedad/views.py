@@ -1,4 +1,9 @@
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models.functions import Length, Substr
+from django.db.models.lookups import GreaterThan
 from django.shortcuts import render
+from .blog_cache import blog_cache_version
 from .models import Persona, Article
 from django.http import JsonResponse
 from django.http import HttpResponse
@@ -8,6 +13,39 @@ from django.template.loader import get_template
 def home(request):
     return render(request, 'index.html')
 
+ARTICLES_PER_PAGE = 20
+EXCERPT_LENGTH = 300
+
+
 def blog_list(request):
-    articles = Article.objects.all().order_by('-fecha')
-    return render(request, 'blog.html', {'articles': articles})
+    """
+    Listado del blog paginado.
+
+    - defer('contenido'): el texto completo no se lee; la base de datos devuelve
+      solo los primeros EXCERPT_LENGTH caracteres como 'extracto' y si el texto
+      era más largo ('truncado')
+    - order_by('-fecha', '-id') usa el índice de fecha y da un orden estable entre páginas
+    - el template cachea el HTML de cada página con la clave de blog_cache_version()
+    """
+    articles = (
+        Article.objects
+        .defer('contenido')
+        .annotate(
+            extracto=Substr('contenido', 1, EXCERPT_LENGTH),
+            truncado=GreaterThan(Length('contenido'), EXCERPT_LENGTH),
+        )
+        .order_by('-fecha', '-id')
+    )
+    version = blog_cache_version()
+    paginator = Paginator(articles, ARTICLES_PER_PAGE)
+    # El total de artículos también se cachea por versión: sin esto el Paginator hace un
+    # COUNT(*) de la tabla en cada petición aunque el fragmento ya esté en cache.
+    # count es un cached_property, asignarlo evita esa consulta
+    paginator.count = cache.get_or_set(f'blog_count:{version}', articles.count, 600)
+    page = paginator.get_page(request.GET.get('page'))
+    # Las filas de la página se consultan recién al recorrerlas en el template:
+    # si el fragmento está en cache no se ejecuta esa consulta
+    return render(request, 'blog.html', {
+        'page': page,
+        'cache_version': version,
+    })
@@ -116,3 +116,13 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/6.0/howto/static-files/
 
 STATIC_URL = 'static/'
+
+# Cache del fragmento de cada página del blog (ver blog.html)
+# locmem vive en la memoria de cada proceso; con varios workers usar FileBasedCache
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'suffolk',
+    }
+}
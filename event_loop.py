@@ -1,13 +1,20 @@
 import asyncio
+import sys
+from contextlib import nullcontext
+
+from loop_instrumentation import instrument
 
 async def tarea(nombre):
     print(f"Hola {nombre}")
 
 async def main():
-    await asyncio.gather(
-        tarea("Ana"),
-        tarea("Bob")
-    )
-    await tarea("Carlos common await")
+    # python event_loop.py --trace: mide tareas y lag del loop y guarda un trace de Chrome
+    medir = instrument(trace_path='event_loop_trace.json') if '--trace' in sys.argv else nullcontext()
+    with medir:
+        await asyncio.gather(
+            tarea("Ana"),
+            tarea("Bob")
+        )
+        await tarea("Carlos common await")
 
-asyncio.run(main())
\ No newline at end of file
+asyncio.run(main())
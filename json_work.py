@@ -1,6 +1,5 @@
-import json
-
-file_path = 'products.json'
+from product_store import ProductStore, import_products_json
+from product_index import log_inserts
 
 new_product = {
     "name": "Wireless Charger",
@@ -11,10 +10,11 @@ new_product = {
     "entry_date": "2024-07-01"
 }
 
-with open(file_path, mode='r') as file:
-    products = json.load(file)
-
-products.append(new_product)
-
-with open(file_path, mode='w') as file:
-    json.dump(products, file, indent=4)
+# Agrega el producto al log JSONL en lugar de reescribir todo products.json
+with ProductStore('products.jsonl') as store:
+    # Cada append agrega una línea al delta del índice: no se lee ni se reescribe el índice entero
+    with log_inserts(store, 'products.index.json'):
+        if len(store) == 0:
+            import_products_json(store, 'products.json')
+        store.append(new_product)
+    print(f"Productos en el almacén: {len(store)}")
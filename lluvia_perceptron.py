@@ -1,54 +1,91 @@
-import random
-
-def perceptron_llueve_o_no():
+import numpy as np
+
+
+class Perceptron:
+    """
+    Perceptrón de N entradas entrenado por lotes con NumPy.
+
+    En lugar de recorrer muestra por muestra, cada actualización calcula las
+    predicciones y errores de todo el lote a la vez y ajusta pesos y sesgo
+    con una sola operación matricial.
+    """
+
+    def __init__(self, n_features, learning_rate=0.1, epochs=100, batch_size=None, seed=None):
+        rng = np.random.default_rng(seed)
+        # Inicialización de los pesos (uno por entrada) y el sesgo
+        self.weights = rng.random(n_features)
+        self.bias = rng.random()
+        self.learning_rate = learning_rate
+        self.epochs = epochs
+        self.batch_size = batch_size  # None = todo el dataset en cada actualización
+
+    def predict(self, X):
+        """Predice 1 o 0 para todas las filas de X (array de forma (muestras, entradas))"""
+        # 1. Suma ponderada  2. Función de activación (salida binaria: 1 o 0)
+        return (X @ self.weights + self.bias >= 0).astype(np.int8)
+
+    def fit(self, X, y, verbose=False):
+        """
+        Entrena el perceptrón.
+
+        Parámetros:
+        X (ndarray): Entradas de forma (muestras, entradas)
+        y (ndarray): Salidas esperadas (0 o 1) de forma (muestras,)
+        verbose (bool): Imprime una línea por muestra y época (muy lento con datasets grandes)
+
+        Retorna:
+        int: Cantidad de épocas ejecutadas
+        """
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.int8)
+        batch_size = self.batch_size or len(X)
+
+        for epoch in range(self.epochs):
+            total_error = 0
+            for start in range(0, len(X), batch_size):
+                X_batch = X[start:start + batch_size]
+                weighted_sum = X_batch @ self.weights + self.bias
+                predicted = (weighted_sum >= 0).astype(np.int8)
+
+                # 3. Calcular el error de todo el lote
+                error = y[start:start + batch_size] - predicted
+                total_error += int(np.abs(error).sum())
+
+                # 4. Ajustar pesos y sesgo con todos los errores del lote
+                self.weights += self.learning_rate * (error @ X_batch)
+                self.bias += self.learning_rate * error.sum()
+
+                if verbose:
+                    for i in range(len(X_batch)):
+                        print(f"--- Internal - training: error: {error[i]} expected: {y[start + i]} "
+                              f"predicted: {predicted[i]} entrada: {X_batch[i]} weighted_sum: {weighted_sum[i]} "
+                              f"weights: {self.weights} bias: {self.bias} ---")
+
+            # Si no hay errores, el perceptrón ha aprendido y el entrenamiento se detiene
+            if total_error == 0:
+                if verbose:
+                    print(f"Entrenamiento completado en la época {epoch + 1}.")
+                return epoch + 1
+        return self.epochs
+
+
+def perceptron_llueve_o_no(verbose=False):
     # Datos de entrenamiento: [esta_lloviendo] -> Salida esperada (1: llevar, 0: no llevar)
-    datos_entrenamiento = [
-        {"entrada": [1], "salida_esperada": 1},  # Lloviendo -> Llevar paraguas
-        {"entrada": [0], "salida_esperada": 0},  # No lloviendo -> No llevar paraguas
-    ]
-
-    # Inicialización del peso (solo uno para la entrada 'esta_lloviendo') y el sesgo
-    weight_lloviendo = random.random()
-    bias = random.random()
-
-    learning_rate = 0.1
-    epochs = 100
-
-    print(f"--- Inicio del entrenamiento (Pesos iniciales: Lloviendo={weight_lloviendo:.4f}, Sesgo={bias:.4f}) ---")
-
-    # Bucle principal de entrenamiento
-    for epoch in range(epochs):
-        total_error = 0
-        for dato in datos_entrenamiento:
-            esta_lloviendo = dato["entrada"][0]
-            expected = dato["salida_esperada"]
-
-            # 1. Calcular la suma ponderada
-            weighted_sum = (esta_lloviendo * weight_lloviendo) + bias
-
-            # 2. Función de activación (salida binaria: 1 o 0)
-            predicted = 1 if weighted_sum >= 0 else 0
-
-            # 3. Calcular el error
-            error = expected - predicted
-            total_error += abs(error)
-
-            # 4. Ajustar peso y sesgo
-            weight_lloviendo += error * esta_lloviendo * learning_rate
-            bias += error * learning_rate
-            print(f"--- Internal - training: error: {error} expected: {expected} predicted: {predicted} esta_lloviendo: {esta_lloviendo} weighted_sum: {weighted_sum} weight: {weight_lloviendo} bias: {bias} ---")
-            
-        # Si no hay errores, el perceptrón ha aprendido y el entrenamiento se detiene
-        if total_error == 0:
-            print(f"Entrenamiento completado en la época {epoch + 1}.")
-            break
-    
-    print(f"--- Entrenamiento finalizado (Pesos finales: Lloviendo={weight_lloviendo:.4f}, Sesgo={bias:.4f}) ---")
-
-    # Retorna una función de predicción para usar el perceptrón entrenado
+    entradas = np.array([[1], [0]])  # Lloviendo / No lloviendo
+    salidas_esperadas = np.array([1, 0])  # Llevar paraguas / No llevar paraguas
+
+    perceptron = Perceptron(n_features=1, learning_rate=0.1, epochs=100)
+
+    print(f"--- Inicio del entrenamiento (Pesos iniciales: Lloviendo={perceptron.weights[0]:.4f}, Sesgo={perceptron.bias:.4f}) ---")
+    epochs = perceptron.fit(entradas, salidas_esperadas, verbose=verbose)
+    print(f"--- Entrenamiento finalizado en {epochs} épocas (Pesos finales: Lloviendo={perceptron.weights[0]:.4f}, Sesgo={perceptron.bias:.4f}) ---")
+
+    # Retorna una función de predicción: acepta un valor o un array completo de valores
     def predecir_paraguas(esta_lloviendo_input):
-        weighted_sum = (esta_lloviendo_input * weight_lloviendo) + bias
-        return 1 if weighted_sum >= 0 else 0
+        entradas = np.asarray(esta_lloviendo_input, dtype=np.float64)
+        if entradas.ndim == 0:
+            return int(perceptron.predict(entradas.reshape(1, 1))[0])
+        return perceptron.predict(entradas.reshape(-1, 1))
 
     return predecir_paraguas
 
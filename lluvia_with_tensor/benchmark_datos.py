@@ -0,0 +1,60 @@
+"""
+Benchmark: arrays en memoria vs pipeline tf.data desde disco
+
+Mide muestras por segundo recorriendo una época completa de cada fuente
+y, opcionalmente, entrenando una época con modelo.fit.
+
+Uso: python benchmark_datos.py [filas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import tensorflow as tf
+
+from datos_streaming import crear_dataset, generar_datos
+
+
+def medir(nombre, dataset, filas):
+    inicio = time.perf_counter()
+    for _ in dataset:
+        pass
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<28} {segundos:8.2f}s  {filas / segundos:>12,.0f} muestras/s")
+
+
+def medir_fit(nombre, x, filas, y=None):
+    modelo = tf.keras.Sequential([tf.keras.layers.Dense(units=1, activation='sigmoid', input_shape=(1,))])
+    modelo.compile(optimizer='adam', loss='binary_crossentropy')
+    inicio = time.perf_counter()
+    modelo.fit(x, y, epochs=1, batch_size=None if y is None else 1024, verbose=0)
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<28} {segundos:8.2f}s  {filas / segundos:>12,.0f} muestras/s (fit)")
+
+
+def main(filas):
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta_csv = os.path.join(tmp, 'lluvia.csv')
+        ruta_jsonl = os.path.join(tmp, 'lluvia.jsonl')
+        print(f"Generando {filas:,} muestras...")
+        generar_datos(ruta_csv, filas, 'csv')
+        generar_datos(ruta_jsonl, filas, 'jsonl')
+
+        # Camino actual de index.py: todo en memoria
+        lluvia = np.random.uniform(0, 10, size=filas).astype(np.float32)
+        paraguas = (lluvia > 5).astype(np.float32)
+        en_memoria = tf.data.Dataset.from_tensor_slices((lluvia.reshape(-1, 1), paraguas)).batch(1024)
+
+        medir('arrays en memoria', en_memoria, filas)
+        medir('tf.data CSV', crear_dataset([ruta_csv], 'csv'), filas)
+        medir('tf.data JSONL', crear_dataset([ruta_jsonl], 'jsonl'), filas)
+
+        medir_fit('arrays en memoria', lluvia.reshape(-1, 1), filas, paraguas)
+        medir_fit('tf.data CSV', crear_dataset([ruta_csv], 'csv'), filas)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
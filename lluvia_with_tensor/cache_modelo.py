@@ -0,0 +1,69 @@
+"""
+Cache en memoria del modelo entrenado.
+
+Carga modelo_paraguas.keras una sola vez por proceso, deja el forward pass
+ya compilado (tf.function) y solo vuelve a cargar si el archivo cambió en
+disco (mtime/tamaño y, si hace falta, el hash del contenido).
+"""
+
+import hashlib
+import os
+import time
+
+import tensorflow as tf
+
+_cache = {}  # ruta -> {'firma', 'hash', 'modelo', 'predictor'}
+
+
+def hash_archivo(ruta):
+    """SHA-256 del archivo, leído por bloques"""
+    sha = hashlib.sha256()
+    with open(ruta, mode='rb') as archivo:
+        for bloque in iter(lambda: archivo.read(1024 * 1024), b''):
+            sha.update(bloque)
+    return sha.hexdigest()
+
+
+def firma_archivo(ruta):
+    info = os.stat(ruta)
+    return info.st_mtime_ns, info.st_size
+
+
+def crear_predictor(modelo):
+    """Compila una sola vez el forward pass del modelo (sin el overhead de modelo.predict)"""
+    @tf.function(input_signature=[tf.TensorSpec(shape=(None, 1), dtype=tf.float32)])
+    def forward(x):
+        return modelo(x, training=False)
+    # Primera llamada: el trazado del grafo se paga acá y no en la primera predicción real
+    forward(tf.zeros((1, 1), dtype=tf.float32))
+    return forward
+
+
+def obtener_modelo(ruta='modelo_paraguas.keras'):
+    """
+    Devuelve (modelo, predictor) desde el cache, recargando si el archivo cambió.
+
+    Lanza FileNotFoundError si el archivo no existe.
+    """
+    firma = firma_archivo(ruta)
+    entrada = _cache.get(ruta)
+    if entrada is not None and entrada['firma'] == firma:
+        return entrada['modelo'], entrada['predictor']
+
+    # El mtime cambió: comparar el contenido antes de recargar (p. ej. un `touch`)
+    contenido = hash_archivo(ruta)
+    if entrada is not None and entrada['hash'] == contenido:
+        entrada['firma'] = firma
+        return entrada['modelo'], entrada['predictor']
+
+    inicio = time.perf_counter()
+    modelo = tf.keras.models.load_model(ruta)
+    predictor = crear_predictor(modelo)
+    print(f"Modelo cargado y compilado en {time.perf_counter() - inicio:.2f}s ({ruta})")
+
+    _cache[ruta] = {'firma': firma, 'hash': contenido, 'modelo': modelo, 'predictor': predictor}
+    return modelo, predictor
+
+
+def limpiar_cache():
+    _cache.clear()
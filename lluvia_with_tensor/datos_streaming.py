@@ -0,0 +1,109 @@
+"""
+Pipeline tf.data para entrenar desde archivos más grandes que la memoria.
+
+Lee CSV (lluvia,paraguas) o JSONL ({"lluvia": x, "paraguas": y}) línea por
+línea desde disco con:
+- lectura intercalada de varios archivos
+- shuffle con buffer acotado
+- batching y parseo vectorizado por lote en paralelo
+- prefetch para que el entrenamiento no espere al disco
+"""
+
+import json
+import random
+
+import tensorflow as tf
+
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+def parsear_csv(lineas):
+    """Convierte un lote de líneas 'lluvia,paraguas' en tensores (x, y)"""
+    lluvia, paraguas = tf.io.decode_csv(lineas, record_defaults=[[0.0], [0.0]])
+    return tf.reshape(lluvia, (-1, 1)), paraguas
+
+
+def extraer_campo(lineas, campo):
+    # JSON plano: se extrae el número con una regex sobre todo el lote (sin Python por fila)
+    valor = tf.strings.regex_replace(lineas, rf'.*"{campo}"\s*:\s*([-+0-9.eE]+).*', r'\1')
+    return tf.strings.to_number(valor, out_type=tf.float32)
+
+
+def parsear_jsonl(lineas):
+    """Convierte un lote de líneas JSON en tensores (x, y)"""
+    return tf.reshape(extraer_campo(lineas, 'lluvia'), (-1, 1)), extraer_campo(lineas, 'paraguas')
+
+
+def crear_dataset(rutas, formato='csv', batch_size=1024, shuffle_buffer=10_000, repetir=False):
+    """
+    Crea un tf.data.Dataset que lee las muestras desde disco.
+
+    Parámetros:
+    rutas (list): Archivos CSV (con cabecera) o JSONL
+    formato (str): 'csv' o 'jsonl'
+    batch_size (int): Muestras por lote
+    shuffle_buffer (int): Tamaño del buffer de mezcla (acota la memoria usada)
+    repetir (bool): Repetir indefinidamente (usar con steps_per_epoch)
+
+    Retorna:
+    tf.data.Dataset: Lotes (x de forma (batch, 1), y de forma (batch,))
+    """
+    saltar = 1 if formato == 'csv' else 0  # Cabecera del CSV
+    parsear = parsear_csv if formato == 'csv' else parsear_jsonl
+
+    archivos = tf.data.Dataset.from_tensor_slices(list(rutas))
+    dataset = archivos.interleave(
+        lambda ruta: tf.data.TextLineDataset(ruta).skip(saltar),
+        cycle_length=len(rutas),
+        num_parallel_calls=AUTOTUNE,
+    )
+    dataset = dataset.filter(lambda linea: tf.strings.length(linea) > 0)
+    if shuffle_buffer:
+        dataset = dataset.shuffle(shuffle_buffer)
+    if repetir:
+        dataset = dataset.repeat()
+    # Parsear después de agrupar: una llamada por lote y no por muestra
+    dataset = dataset.batch(batch_size).map(parsear, num_parallel_calls=AUTOTUNE)
+    return dataset.prefetch(AUTOTUNE)
+
+
+def detectar_formato(ruta):
+    return 'jsonl' if ruta.endswith('.jsonl') else 'csv'
+
+
+def crear_dataset_archivos(rutas, **opciones):
+    """
+    Como crear_dataset pero acepta CSV y JSONL mezclados, según la extensión.
+
+    Se arma un dataset por formato (cada uno con su parseo y su cabecera) y se
+    intercalan sus lotes con sample_from_datasets hasta agotar todos.
+
+    Retorna:
+    tf.data.Dataset: Lotes (x de forma (batch, 1), y de forma (batch,))
+    """
+    por_formato = {}
+    for ruta in rutas:
+        por_formato.setdefault(detectar_formato(ruta), []).append(ruta)
+    datasets = [crear_dataset(rutas_formato, formato, **opciones) for formato, rutas_formato in por_formato.items()]
+    if len(datasets) == 1:
+        return datasets[0]
+    return tf.data.Dataset.sample_from_datasets(datasets).prefetch(AUTOTUNE)
+
+
+def generar_datos(ruta, filas, formato='csv'):
+    """Genera un archivo sintético de sensores de lluvia (paraguas = lluvia > 5)"""
+    with open(ruta, mode='w') as archivo:
+        if formato == 'csv':
+            archivo.write('lluvia,paraguas\n')
+        lote = []
+        for _ in range(filas):
+            lluvia = round(random.uniform(0, 10), 2)
+            paraguas = 1 if lluvia > 5 else 0
+            if formato == 'csv':
+                lote.append(f"{lluvia},{paraguas}\n")
+            else:
+                lote.append(json.dumps({'lluvia': lluvia, 'paraguas': paraguas}) + '\n')
+            if len(lote) == 10_000:
+                archivo.writelines(lote)
+                lote.clear()
+        archivo.writelines(lote)
@@ -2,38 +2,81 @@
 Demo: Usar el modelo ya entrenado para predicciones
 """
 
+import time
+from itertools import islice
+
+# Referencia para medir la latencia desde el arranque hasta la primera predicción
+INICIO_PROCESO = time.perf_counter()
+
 import tensorflow as tf
 import numpy as np
 
+from cache_modelo import obtener_modelo
+
 def cargar_modelo():
-    """Carga el modelo previamente entrenado"""
+    """Carga el modelo previamente entrenado (desde el cache si ya está en memoria)"""
     try:
         print("Cargando modelo entrenado...")
-        modelo = tf.keras.models.load_model('modelo_paraguas.keras')
+        modelo, predictor = obtener_modelo('modelo_paraguas.keras')
         print("✅ Modelo cargado exitosamente!")
-        return modelo
+        return modelo, predictor
     except FileNotFoundError:
         print("❌ Error: No se encontró el archivo 'modelo_paraguas.keras'")
         print("Primero ejecuta 'python index.py' para entrenar y guardar el modelo")
-        return None
+        return None, None
 
-def predecir_paraguas(modelo, intensidad_lluvia):
+def predecir_lote(predictor, intensidades, batch_size=1024):
+    """
+    Predice la probabilidad de llevar paraguas para muchas intensidades.
+
+    Parámetros:
+    predictor: Función creada con cache_modelo.crear_predictor
+    intensidades: Array o iterador de intensidades de lluvia
+    batch_size (int): Cantidad de valores por forward pass
+
+    Retorna:
+    tuple: (array de probabilidades, lista de latencias por lote en segundos)
+    """
+    iterador = iter(intensidades)
+    probabilidades = []
+    latencias = []
+    while True:
+        lote = np.fromiter(islice(iterador, batch_size), dtype=np.float32)
+        if lote.size == 0:
+            break
+        inicio = time.perf_counter()
+        salida = predictor(tf.constant(lote.reshape(-1, 1))).numpy()
+        latencias.append(time.perf_counter() - inicio)
+        probabilidades.append(salida[:, 0])
+    if not probabilidades:
+        return np.empty(0, dtype=np.float32), latencias
+    return np.concatenate(probabilidades), latencias
+
+def reporte_latencias(latencias, total):
+    """Muestra latencia por lote y throughput total"""
+    if not latencias:
+        return
+    tiempo_total = sum(latencias)
+    ordenadas = sorted(latencias)
+    p50 = ordenadas[len(ordenadas) // 2]
+    p99 = ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * 0.99))]
+    print(f"Lotes: {len(latencias)} | latencia p50: {p50 * 1000:.2f} ms | p99: {p99 * 1000:.2f} ms | "
+          f"throughput: {total / tiempo_total:,.0f} predicciones/s")
+
+def predecir_paraguas(predictor, intensidad_lluvia):
     """Predice si llevar paraguas según la intensidad de lluvia"""
-    # Hacer predicción
-    prediccion = modelo.predict(
-        np.array([intensidad_lluvia]), 
-        verbose=0  # Sin mensajes de TensorFlow
-    )
+    # Hacer predicción (un lote de un solo valor)
+    probabilidades, _ = predecir_lote(predictor, [intensidad_lluvia])
     
     # Convertir probabilidad a decisión
-    probabilidad = prediccion[0][0]
+    probabilidad = probabilidades[0]
     decision = "SÍ" if probabilidad > 0.5 else "NO"
     
     return decision, probabilidad
 
 def main():
     # Cargar modelo
-    modelo = cargar_modelo()
+    modelo, predictor = cargar_modelo()
     if modelo is None:
         return
     
@@ -43,9 +86,18 @@ def main():
     # Probar con diferentes valores
     valores_test = [1, 3, 5, 7, 9, 10]
     
-    for lluvia in valores_test:
-        decision, probabilidad = predecir_paraguas(modelo, lluvia)
+    # Todos los valores en un solo forward pass
+    probabilidades, latencias = predecir_lote(predictor, valores_test)
+    print(f"⏱️  Arranque hasta la primera predicción: {time.perf_counter() - INICIO_PROCESO:.2f}s")
+    for lluvia, probabilidad in zip(valores_test, probabilidades):
+        decision = "SÍ" if probabilidad > 0.5 else "NO"
         print(f"Lluvia {lluvia}/10: {decision} llevo paraguas (probabilidad: {probabilidad:.2f})")
+    reporte_latencias(latencias, len(valores_test))
+
+    # Throughput con un lote grande de intensidades aleatorias
+    intensidades = np.random.uniform(0, 10, size=100_000)
+    _, latencias = predecir_lote(predictor, intensidades, batch_size=4096)
+    reporte_latencias(latencias, len(intensidades))
     
     # Modo interactivo
     print("\n" + "=" * 30)
@@ -59,7 +111,7 @@ def main():
             
             intensidad = float(entrada)
             if 0 <= intensidad <= 10:
-                decision, probabilidad = predecir_paraguas(modelo, intensidad)
+                decision, probabilidad = predecir_paraguas(predictor, intensidad)
                 print(f"🌂 Resultado: {decision} llevo paraguas (confianza: {probabilidad:.2f})")
             else:
                 print("⚠️  Por favor ingresa un valor entre 0 y 10")
@@ -5,42 +5,98 @@ Si llueve poco (<5) = no llevo paraguas (0)
 """
 
 # Importar librerías necesarias
+import hashlib
+import json
+import os
+import sys
+import time
+
 import tensorflow as tf  # TensorFlow: librería principal para machine learning
 import numpy as np       # NumPy: manejo de arrays numéricos (requerido por TensorFlow)
 
+RUTA_MODELO = 'modelo_paraguas.keras'
+RUTA_META = 'modelo_paraguas.meta.json'  # Hash del dataset con el que se entrenó el modelo
+
+# Archivos de sensores opcionales: python index.py datos1.csv datos2.jsonl ...
+# (CSV y JSONL se pueden mezclar: el formato de cada uno sale de su extensión)
+# Si se pasan, se entrena en streaming con tf.data en lugar de usar los arrays de abajo
+ARCHIVOS_DATOS = sys.argv[1:]
+
 # Datos súper simples
 # np.array() convierte listas de Python a arrays de NumPy (requerido por TensorFlow)
 lluvia = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10] * 100)  # Intensidad de lluvia (0-10)
 paraguas = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1] * 100)  # 0=no paraguas, 1=sí paraguas
 
-# Crear modelo súper simple
-# tf.keras.Sequential() crea un modelo de capas apiladas (una después de otra)
-modelo = tf.keras.Sequential([
-    # tf.keras.layers.Dense() crea una capa completamente conectada
-    tf.keras.layers.Dense(
-        units=1,                    # units: número de neuronas en la capa (1 neurona)
-        activation='sigmoid',       # activation: función de activación (sigmoid = 0 a 1)
-        input_shape=(1,)            # input_shape: forma de entrada (1 característica)
+def hash_dataset(*arrays):
+    """Huella del dataset: si cambia, no tiene sentido reutilizar los pesos"""
+    sha = hashlib.sha256()
+    for array in arrays:
+        sha.update(str(array.dtype).encode())
+        sha.update(array.tobytes())
+    return sha.hexdigest()
+
+def crear_modelo():
+    # Crear modelo súper simple
+    # tf.keras.Sequential() crea un modelo de capas apiladas (una después de otra)
+    modelo = tf.keras.Sequential([
+        # tf.keras.layers.Dense() crea una capa completamente conectada
+        tf.keras.layers.Dense(
+            units=1,                    # units: número de neuronas en la capa (1 neurona)
+            activation='sigmoid',       # activation: función de activación (sigmoid = 0 a 1)
+            input_shape=(1,)            # input_shape: forma de entrada (1 característica)
+        )
+    ])
+
+    # Compilar modelo
+    # modelo.compile() configura cómo el modelo va a aprender
+    modelo.compile(
+        optimizer=tf.keras.optimizers.Adam(learning_rate=0.01),                    # optimizer: algoritmo de optimización (Adam es inteligente)
+        loss='binary_crossentropy',         # loss: función de pérdida para problemas sí/no
+        metrics=['accuracy']                # metrics: qué medir durante el entrenamiento (precisión)
     )
-])
+    return modelo
+
+def cargar_pesos_previos(huella):
+    """Devuelve el modelo guardado si se entrenó con el mismo dataset, si no None"""
+    if not (os.path.exists(RUTA_MODELO) and os.path.exists(RUTA_META)):
+        return None
+    with open(RUTA_META, mode='r') as archivo:
+        meta = json.load(archivo)
+    if meta.get('dataset') != huella:
+        return None
+    return tf.keras.models.load_model(RUTA_MODELO)
 
-# Compilar modelo
-# modelo.compile() configura cómo el modelo va a aprender
-modelo.compile(
-    optimizer=tf.keras.optimizers.Adam(learning_rate=0.01),                    # optimizer: algoritmo de optimización (Adam es inteligente)
-    loss='binary_crossentropy',         # loss: función de pérdida para problemas sí/no
-    metrics=['accuracy']                # metrics: qué medir durante el entrenamiento (precisión)
-)
+if ARCHIVOS_DATOS:
+    from cache_modelo import hash_archivo
+    from datos_streaming import crear_dataset_archivos
+    huella = hashlib.sha256(''.join(hash_archivo(ruta) for ruta in ARCHIVOS_DATOS).encode()).hexdigest()
+else:
+    huella = hash_dataset(lluvia, paraguas)
+inicio = time.perf_counter()
+modelo = cargar_pesos_previos(huella)
+if modelo is None:
+    print("Dataset nuevo o sin modelo guardado: entrenando desde cero")
+    modelo = crear_modelo()
+    epocas = 100
+else:
+    # Warm-start: se continúa desde los últimos pesos guardados
+    print("Mismo dataset: continuando desde los pesos guardados")
+    epocas = 10
+print(f"Modelo listo en {time.perf_counter() - inicio:.2f}s")
 
 # Entrenar modelo
 print("Entrenando modelo...")
 # modelo.fit() entrena el modelo con los datos
-modelo.fit(
-    lluvia,         # x: datos de entrada (intensidad de lluvia)
-    paraguas,       # y: datos de salida (llevar paraguas o no)
-    epochs=100,     # epochs: cuántas veces ver todos los datos (100 iteraciones)
-    verbose=1       # verbose: mostrar progreso (0=sin mostrar, 1=mostrar)
-)
+if ARCHIVOS_DATOS:
+    # El dataset lee, mezcla y agrupa desde disco: la memoria no depende del tamaño de los archivos
+    modelo.fit(crear_dataset_archivos(ARCHIVOS_DATOS), epochs=epocas, verbose=1)
+else:
+    modelo.fit(
+        lluvia,         # x: datos de entrada (intensidad de lluvia)
+        paraguas,       # y: datos de salida (llevar paraguas o no)
+        epochs=epocas,  # epochs: cuántas veces ver todos los datos (100 desde cero, 10 en warm-start)
+        verbose=1       # verbose: mostrar progreso (0=sin mostrar, 1=mostrar)
+    )
 
 # Probar modelo
 print("\nProbando modelo:")
@@ -61,7 +117,9 @@ print("\n¡Listo!")
 
 # NUEVO: Guardar el modelo entrenado
 print("\nGuardando modelo...")
-modelo.save('modelo_paraguas.keras')
-print("Modelo guardado como 'modelo_paraguas.h5'")
+modelo.save(RUTA_MODELO)
+with open(RUTA_META, mode='w') as archivo:
+    json.dump({'dataset': huella}, archivo)
+print(f"Modelo guardado como '{RUTA_MODELO}'")
 
 print("\n¡Entrenamiento completado y modelo guardado!")
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Instrumentación del event loop de asyncio.
+
+Uso, dentro de cualquier corrutina principal:
+
+    async def main():
+        with instrument(slow_callback=0.05, trace_path='trace.json'):
+            await asyncio.gather(tarea("Ana"), tarea("Bob"))
+
+Mide:
+- duración de cada tarea (desde que se crea hasta que termina)
+- callbacks lentos que bloquean el loop más que el umbral configurado
+- lag del loop (cuánto tarda en despertar un sleep respecto de lo pedido)
+- cantidad de tareas pendientes en cada muestra
+
+y puede exportar todo como trace de Chrome (abrir en chrome://tracing o Perfetto).
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+
+
+class _SlowCallbackHandler(logging.Handler):
+    # En modo debug asyncio avisa por logging cuando un callback supera slow_callback_duration
+    def __init__(self, instrumentation):
+        super().__init__(level=logging.WARNING)
+        self.instrumentation = instrumentation
+
+    def emit(self, record):
+        if record.msg.startswith('Executing') and len(record.args) == 2:
+            handle, seconds = record.args
+            self.instrumentation.slow_callbacks.append((time.perf_counter(), str(handle), seconds))
+
+
+class LoopInstrumentation:
+    def __init__(self, slow_callback=0.1, lag_interval=0.05, trace_path=None, report=True):
+        self.slow_callback = slow_callback  # Segundos a partir de los cuales un callback es lento
+        self.lag_interval = lag_interval  # Segundos entre muestras de lag
+        self.trace_path = trace_path
+        self.report = report
+        self.tasks = []  # (nombre, inicio, fin)
+        self.slow_callbacks = []  # (momento, callback, segundos)
+        self.samples = []  # (momento, lag en segundos, tareas pendientes)
+        self.origin = time.perf_counter()
+
+    def __enter__(self):
+        self.loop = asyncio.get_running_loop()
+        self.previous_factory = self.loop.get_task_factory()
+        self.previous_debug = self.loop.get_debug()
+        self.previous_slow = self.loop.slow_callback_duration
+
+        self.sampler = self.loop.create_task(self._sample_lag(), name='loop-lag-sampler')
+        self.loop.set_task_factory(self._task_factory)
+        self.loop.set_debug(True)
+        self.loop.slow_callback_duration = self.slow_callback
+        self.handler = _SlowCallbackHandler(self)
+        logging.getLogger('asyncio').addHandler(self.handler)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.sampler.cancel()
+        self.loop.set_task_factory(self.previous_factory)
+        self.loop.set_debug(self.previous_debug)
+        self.loop.slow_callback_duration = self.previous_slow
+        logging.getLogger('asyncio').removeHandler(self.handler)
+        if self.trace_path:
+            self.export_trace(self.trace_path)
+        if self.report:
+            self.print_report()
+        return False
+
+    def _task_factory(self, loop, coro, **kwargs):
+        if self.previous_factory is not None:
+            task = self.previous_factory(loop, coro, **kwargs)
+        else:
+            task = asyncio.Task(coro, loop=loop, **kwargs)
+        start = time.perf_counter()
+        name = f"{getattr(coro, '__qualname__', type(coro).__name__)} ({task.get_name()})"
+        task.add_done_callback(lambda _: self.tasks.append((name, start, time.perf_counter())))
+        return task
+
+    async def _sample_lag(self):
+        while True:
+            expected = time.perf_counter() + self.lag_interval
+            await asyncio.sleep(self.lag_interval)
+            now = time.perf_counter()
+            self.samples.append((now, max(0.0, now - expected), len(asyncio.all_tasks(self.loop))))
+
+    def print_report(self):
+        print(f"--- Instrumentación del event loop ---")
+        for name, start, end in sorted(self.tasks, key=lambda task: task[1]):
+            print(f"tarea {name}: {(end - start) * 1000:.2f} ms")
+        for _, handle, seconds in self.slow_callbacks:
+            print(f"callback lento ({seconds * 1000:.1f} ms): {handle}")
+        if self.samples:
+            lags = [lag for _, lag, _ in self.samples]
+            print(f"lag del loop: máx {max(lags) * 1000:.2f} ms, promedio {sum(lags) / len(lags) * 1000:.2f} ms "
+                  f"({len(lags)} muestras), tareas pendientes máx {max(p for _, _, p in self.samples)}")
+
+    def trace_events(self):
+        """Eventos en formato Chrome trace-event (tiempos en microsegundos)"""
+        pid = os.getpid()
+        tid = threading.get_ident()
+
+        def us(moment):
+            return (moment - self.origin) * 1_000_000
+
+        events = []
+        for name, start, end in self.tasks:
+            events.append({'name': name, 'cat': 'task', 'ph': 'X', 'ts': us(start),
+                           'dur': us(end) - us(start), 'pid': pid, 'tid': tid})
+        for moment, handle, seconds in self.slow_callbacks:
+            # El aviso llega al terminar el callback: el evento empieza `seconds` antes
+            events.append({'name': handle, 'cat': 'slow_callback', 'ph': 'X', 'ts': us(moment - seconds),
+                           'dur': seconds * 1_000_000, 'pid': pid, 'tid': tid})
+        for moment, lag, pending in self.samples:
+            events.append({'name': 'loop', 'ph': 'C', 'ts': us(moment), 'pid': pid,
+                           'args': {'lag_ms': lag * 1000, 'pending_tasks': pending}})
+        return events
+
+    def export_trace(self, path):
+        with open(path, mode='w') as file:
+            json.dump({'traceEvents': self.trace_events()}, file)
+
+
+def instrument(slow_callback=0.1, lag_interval=0.05, trace_path=None, report=True):
+    """Context manager para instrumentar el loop actual (usar dentro de una corrutina)"""
+    return LoopInstrumentation(slow_callback, lag_interval, trace_path, report)
@@ -0,0 +1,146 @@
+"""
+Lectura de products.csv / archivos JSONL con mmap.
+
+El archivo se mapea en memoria en modo solo lectura y los registros se
+encuentran buscando b'\\n' dentro del buffer. Cada registro se entrega como
+un memoryview (sin copiar bytes). Varios procesos que mapean el mismo
+archivo comparten las mismas páginas del page cache del sistema operativo.
+"""
+
+import csv
+import json
+import mmap
+import multiprocessing
+import os
+
+
+class MappedFile:
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, mode='rb')
+        size = os.fstat(self.file.fileno()).st_size
+        # mmap no acepta archivos vacíos
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.view = memoryview(self.map) if self.map is not None else memoryview(b'')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return len(self.view)
+
+    def records(self, start=0, end=None):
+        """
+        Genera un memoryview por cada línea entre los bytes start y end.
+
+        Las líneas vacías se saltan y el salto de línea (\\n o \\r\\n) no se incluye.
+        Sirve para JSONL o CSV sin saltos de línea dentro de campos entre comillas:
+        un campo así quedaría partido en dos registros (ver lines()).
+        """
+        if self.map is None:
+            return
+        end = len(self.view) if end is None else end
+        find = self.map.find
+        view = self.view
+        position = start
+        while position < end:
+            newline = find(b'\n', position, end)
+            stop = end if newline == -1 else newline
+            record_end = stop - 1 if stop > position and view[stop - 1] == 13 else stop  # 13 = '\r'
+            if record_end > position:
+                yield view[position:record_end]
+            position = stop + 1
+
+    def lines(self, start=0, end=None):
+        """
+        Genera un memoryview por cada línea entre start y end, incluido su salto de
+        línea y sin saltar las vacías: lo que necesita csv.reader para reconstruir
+        campos entre comillas que contienen saltos de línea.
+        """
+        if self.map is None:
+            return
+        end = len(self.view) if end is None else end
+        find = self.map.find
+        view = self.view
+        position = start
+        while position < end:
+            newline = find(b'\n', position, end)
+            stop = end if newline == -1 else newline + 1
+            yield view[position:stop]
+            position = stop
+
+    def line_start(self, offset):
+        """Ajusta un offset al comienzo de la línea siguiente (o lo deja si ya lo es)"""
+        if offset <= 0 or self.map is None:
+            return 0
+        if offset >= len(self.view) or self.view[offset - 1] == 10:  # 10 = '\n'
+            return min(offset, len(self.view))
+        newline = self.map.find(b'\n', offset)
+        return len(self.view) if newline == -1 else newline + 1
+
+    def ranges(self, parts):
+        """Divide el archivo en `parts` rangos de bytes alineados a líneas"""
+        size = len(self.view)
+        bounds = [self.line_start(size * i // parts) for i in range(parts)] + [size]
+        return [(bounds[i], bounds[i + 1]) for i in range(parts) if bounds[i] < bounds[i + 1]]
+
+    def close(self):
+        self.view.release()
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                # Todavía hay slices en uso: el mmap se libera con el último de ellos
+                pass
+        self.file.close()
+
+
+def iter_csv(path, encoding='utf-8'):
+    """
+    Filas de un CSV como listas de strings, leídas desde el mmap.
+
+    Acepta campos entre comillas con saltos de línea; las filas vacías se
+    saltan, igual que en csv.DictReader.
+    """
+    with MappedFile(path) as mapped:
+        lines = (bytes(line).decode(encoding) for line in mapped.lines())
+        for row in csv.reader(lines):
+            if row:
+                yield row
+
+
+def iter_jsonl(path):
+    """Registros de un archivo JSON Lines leídos desde el mmap"""
+    with MappedFile(path) as mapped:
+        for record in mapped.records():
+            # json.loads acepta bytes directamente
+            yield json.loads(record.tobytes())
+
+
+def count_range(args):
+    # Cada worker mapea el archivo por su cuenta: las páginas se comparten
+    path, start, end = args
+    with MappedFile(path) as mapped:
+        return sum(1 for _ in mapped.records(start, end))
+
+
+def parallel_count(path, workers=None):
+    """
+    Cuenta las líneas no vacías de un archivo repartiendo rangos entre procesos.
+
+    Es la cantidad de registros en JSONL o en un CSV sin saltos de línea entre comillas.
+    """
+    workers = workers or os.cpu_count()
+    with MappedFile(path) as mapped:
+        ranges = mapped.ranges(workers)
+    with multiprocessing.Pool(workers) as pool:
+        return sum(pool.map(count_range, [(path, start, end) for start, end in ranges]))
+
+
+if __name__ == "__main__":
+    for row in iter_csv('products.csv'):
+        print(row)
+    print(f"Registros en products.csv: {parallel_count('products.csv')}")
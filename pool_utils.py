@@ -0,0 +1,12 @@
+"""
+Utilidades compartidas para multiprocessing.Pool.
+
+Lo usan csv_parallel.py y concurrencia-y-paralelismo/job_runner.py (este último
+lo carga con concurrencia-y-paralelismo/root_modules.py).
+"""
+
+
+def auto_chunksize(tasks, workers):
+    # Misma heurística que Pool.map: unas 4 tandas por worker en lugar de 1 tarea por envío
+    chunksize, extra = divmod(tasks, workers * 4)
+    return chunksize + 1 if extra else max(chunksize, 1)
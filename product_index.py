@@ -0,0 +1,191 @@
+"""
+Índices secundarios sobre el catálogo de productos (ProductStore).
+
+- Índices hash sobre brand y category: valor -> lista de ids
+- Índice ordenado sobre entry_date: lista de (fecha, id) ordenada con bisect
+
+Las consultas devuelven ids y los registros se leen con store.get_many(),
+sin recorrer todo el archivo.
+
+En disco el índice es un JSON completo (path) más un delta append-only
+(path + '.delta', una línea [id, campos indexados] por registro). Guardar o
+registrar una inserción solo agrega líneas al delta; el JSON completo se
+reescribe cuando el delta pasa a tener más registros que él (costo amortizado
+O(1)). El índice recuerda cuántos registros del almacén cubre y al adjuntarse
+indexa solo los que faltan.
+"""
+
+import json
+import os
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from contextlib import contextmanager
+
+from product_store import truncate_partial_line
+
+HASH_FIELDS = ('brand', 'category')
+DATE_FIELD = 'entry_date'
+INDEXED_FIELDS = HASH_FIELDS + (DATE_FIELD,)
+DELTA_SUFFIX = '.delta'
+
+
+def delta_line(record_id, product):
+    fields = {field: product[field] for field in INDEXED_FIELDS if field in product}
+    return json.dumps([record_id, fields], ensure_ascii=False) + '\n'
+
+
+class ProductIndex:
+    def __init__(self):
+        self.hash = {field: defaultdict(list) for field in HASH_FIELDS}
+        self.dates = []  # [(entry_date, record_id)] siempre ordenada
+        self.count = 0  # Cantidad de registros indexados
+        self.base_count = 0  # Registros guardados en el JSON completo
+        self.delta_count = 0  # Registros guardados en el delta
+        self.unsaved = []  # Líneas del delta de los registros indexados desde el último save()
+
+    def add(self, record_id, product):
+        """Indexa un producto (se usa como listener de ProductStore)"""
+        self._index(record_id, product)
+        self.unsaved.append(delta_line(record_id, product))
+
+    def _index(self, record_id, product):
+        for field in HASH_FIELDS:
+            if field in product:
+                self.hash[field][product[field]].append(record_id)
+        if DATE_FIELD in product:
+            # Las inserciones suelen venir en orden de fecha: insort cae al final
+            insort(self.dates, (product[DATE_FIELD], record_id))
+        self.count = max(self.count, record_id + 1)
+
+    def attach(self, store):
+        """Pone el índice al día con el almacén y lo suscribe a nuevas inserciones"""
+        if self.count > len(store):
+            # El índice cubre registros que el almacén no tiene (se reemplazó o se
+            # perdió el log): no se puede confiar en él, se vuelve a armar entero
+            self.__init__()
+        missing = range(self.count, len(store))
+        for record_id, product in zip(missing, store.get_many(missing)):
+            self.add(record_id, product)
+        store.listeners.append(self.add)
+
+    def lookup(self, field, value):
+        """Búsqueda puntual en un índice hash, por ejemplo lookup('brand', 'TechGear')"""
+        return list(self.hash[field].get(value, ()))
+
+    def date_range(self, start=None, end=None):
+        """
+        Ids con entry_date entre start y end (ambos inclusive).
+
+        Acepta prefijos: date_range('2024-02', '2024-05') incluye todo mayo.
+        """
+        low = bisect_left(self.dates, (start,)) if start else 0
+        # '~' es mayor que cualquier dígito o '-', así el prefijo end abarca todo el período
+        high = bisect_right(self.dates, (end + '~',)) if end else len(self.dates)
+        return [record_id for _, record_id in self.dates[low:high]]
+
+    def query(self, start=None, end=None, **equals):
+        """
+        Combina búsquedas: query(category='Accessories', start='2024-02', end='2024-05')
+
+        Retorna:
+        list: Ids ordenados por fecha de ingreso
+        """
+        ids = None
+        for field, value in equals.items():
+            matches = set(self.lookup(field, value))
+            ids = matches if ids is None else ids & matches
+        if start is None and end is None:
+            return sorted(ids) if ids is not None else list(range(self.count))
+        in_range = self.date_range(start, end)
+        if ids is None:
+            return in_range
+        return [record_id for record_id in in_range if record_id in ids]
+
+    def save(self, path):
+        """Agrega al delta lo indexado desde el último save, o reescribe todo si el delta ya es grande"""
+        delta_count = self.delta_count + len(self.unsaved)
+        if not self.base_count or delta_count > self.base_count or not os.path.exists(path):
+            self._save_full(path)
+        elif self.unsaved:
+            with open(path + DELTA_SUFFIX, mode='a', encoding='utf-8') as file:
+                file.writelines(self.unsaved)
+            self.delta_count = delta_count
+        self.unsaved = []
+
+    def _save_full(self, path):
+        data = {
+            'count': self.count,
+            'hash': self.hash,
+            'dates': self.dates,
+        }
+        tmp_path = path + '.tmp'
+        with open(tmp_path, mode='w', encoding='utf-8') as file:
+            json.dump(data, file)
+        os.replace(tmp_path, path)
+        # Si se corta antes de borrar el delta, load() ignora las líneas que ya están en el JSON
+        if os.path.exists(path + DELTA_SUFFIX):
+            os.remove(path + DELTA_SUFFIX)
+        self.base_count = self.count
+        self.delta_count = 0
+
+    @classmethod
+    def load(cls, path):
+        """Carga un índice guardado (JSON completo más delta); si no existe devuelve uno vacío"""
+        index = cls()
+        if os.path.exists(path):
+            with open(path, mode='r', encoding='utf-8') as file:
+                data = json.load(file)
+            index.count = index.base_count = data['count']
+            for field in HASH_FIELDS:
+                index.hash[field].update(data['hash'].get(field, {}))
+            index.dates = [tuple(entry) for entry in data['dates']]
+
+        delta_path = path + DELTA_SUFFIX
+        if os.path.exists(delta_path):
+            truncate_partial_line(delta_path)  # Una escritura cortada no se mezcla con las próximas
+            with open(delta_path, mode='r', encoding='utf-8') as file:
+                for line in file:
+                    record_id, fields = json.loads(line)
+                    if record_id < index.count:
+                        continue  # Ya incluido en el JSON completo
+                    if record_id > index.count:
+                        # Falta un registro en el medio: attach() indexa el resto desde el almacén
+                        # y el próximo save() reescribe todo sin este delta
+                        index.base_count = 0
+                        break
+                    index._index(record_id, fields)
+                    index.delta_count += 1
+        return index
+
+
+@contextmanager
+def log_inserts(store, path):
+    """
+    Dentro del with, registra en el delta del índice cada inserción del almacén
+    sin cargar el índice (load() las aplica después).
+    """
+    with open(path + DELTA_SUFFIX, mode='a', encoding='utf-8') as delta:
+        def listener(record_id, product):
+            delta.write(delta_line(record_id, product))
+
+        store.listeners.append(listener)
+        try:
+            yield
+        finally:
+            store.listeners.remove(listener)
+
+
+if __name__ == "__main__":
+    from product_store import ProductStore, import_products_json
+
+    with ProductStore('products.jsonl') as store:
+        if len(store) == 0:
+            import_products_json(store, 'products.json')
+        index = ProductIndex.load('products.index.json')
+        index.attach(store)
+
+        ids = index.query(category='Accessories', start='2024-02', end='2024-05')
+        for product in store.get_many(ids):
+            print(product['entry_date'], product['name'])
+
+        index.save('products.index.json')
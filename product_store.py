@@ -0,0 +1,343 @@
+"""
+Almacén de productos append-only sobre JSON Lines.
+
+Cada inserción agrega una línea al log (O(1)) en lugar de reescribir todo
+products.json. El fsync se hace por lotes y, cuando el log crece tanto como
+el snapshot, se compacta todo en un nuevo snapshot (costo amortizado O(1)).
+
+Cada registro tiene un id (su posición de inserción) y el almacén guarda el
+offset en bytes de cada uno, así get() lee un registro sin recorrer el archivo.
+Los offsets se guardan junto a cada archivo (<archivo>.offsets): abrir el almacén
+no relee el catálogo, solo la cola del log escrita después del último sync().
+
+La primera línea del snapshot y del log es una cabecera {"__store__": {"generation": g}}.
+Cada compactación crea un snapshot de la generación siguiente y recién después
+reemplaza el log: si al abrir el log es de una generación anterior a la del
+snapshot, sus registros ya están en el snapshot y se descarta. Los archivos sin
+cabecera (de versiones anteriores) cuentan como generación 0.
+"""
+
+import json
+import os
+from array import array
+
+OFFSET_SIZE = 8  # Cada offset se guarda como entero sin signo de 8 bytes ('Q')
+HEADER_KEY = '__store__'
+HEADER_PREFIX = b'{"__store__":'  # Un producto no puede empezar con la clave __store__
+
+
+class OffsetIndex:
+    """
+    Offsets en bytes de los registros de un archivo JSONL, persistidos en
+    data_path + '.offsets'.
+
+    Abrirlo cuesta O(1) más la cola sin indexar: la cantidad sale del tamaño del
+    archivo de offsets y esos offsets se cargan recién cuando se pide alguno.
+    """
+
+    def __init__(self, data_path):
+        self.data_path = data_path
+        self.path = data_path + '.offsets'
+        self.persisted = 0  # Offsets ya escritos en self.path
+        self.loaded = None  # array con los persistidos, se lee a demanda
+        self.new = array('Q')  # Offsets agregados todavía sin guardar
+        self._open()
+
+    def _open(self):
+        data_size = os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0
+        end = 0  # Byte del archivo de datos hasta donde llegan los offsets guardados
+        if os.path.exists(self.path):
+            size = os.path.getsize(self.path)
+            self.persisted = size // OFFSET_SIZE
+            with open(self.path, mode='r+b') as file:
+                if size % OFFSET_SIZE:
+                    file.truncate(self.persisted * OFFSET_SIZE)  # Escritura cortada a la mitad
+                if self.persisted:
+                    file.seek((self.persisted - 1) * OFFSET_SIZE)
+                    last = array('Q', file.read(OFFSET_SIZE))[0]
+            if self.persisted:
+                if last >= data_size:
+                    # Los offsets no corresponden a este archivo (se cortó una compactación)
+                    self.persisted = 0
+                    os.remove(self.path)
+                else:
+                    with open(self.data_path, mode='rb') as data:
+                        data.seek(last)
+                        end = last + len(data.readline())
+        # Solo se recorren los registros escritos después de los offsets guardados
+        self.new.extend(scan_offsets(self.data_path, start=end))
+
+    def __len__(self):
+        return self.persisted + len(self.new)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if i >= self.persisted:
+            return self.new[i - self.persisted]
+        if self.loaded is None:
+            self.loaded = array('Q')
+            with open(self.path, mode='rb') as file:
+                self.loaded.fromfile(file, self.persisted)
+        return self.loaded[i]
+
+    def append(self, offset):
+        self.new.append(offset)
+
+    def flush(self):
+        """Guarda los offsets nuevos; llamarlo después del fsync de los datos"""
+        if not self.new:
+            return
+        with open(self.path, mode='ab') as file:
+            self.new.tofile(file)
+            file.flush()
+            os.fsync(file.fileno())
+        if self.loaded is not None:
+            self.loaded.extend(self.new)
+        self.persisted += len(self.new)
+        self.new = array('Q')
+
+    def discard(self):
+        """Borra los offsets guardados (antes de reemplazar o vaciar el archivo de datos)"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.persisted = 0
+        self.loaded = None
+        self.new = array('Q')
+
+    def replace(self, offsets):
+        """Guarda offsets como el índice completo del archivo de datos"""
+        self.discard()
+        self.new = array('Q', offsets)
+        self.flush()
+
+
+class ProductStore:
+    def __init__(self, log_path='products.jsonl', snapshot_path='products.snapshot.jsonl',
+                 fsync_every=100, compact_min=1_000):
+        self.log_path = log_path
+        self.snapshot_path = snapshot_path
+        self.fsync_every = fsync_every  # Registros entre cada fsync
+        self.compact_min = compact_min  # Tamaño mínimo del log para compactar
+        self.generation = read_generation(snapshot_path)
+        self.snapshot_offsets = OffsetIndex(snapshot_path)
+        # El snapshot ya está completo en disco: si hubo que recalcular sus offsets se guardan
+        self.snapshot_offsets.flush()
+        if not os.path.exists(log_path) or read_generation(log_path) < self.generation:
+            # Log nuevo, o una compactación se cortó después de reemplazar el snapshot:
+            # todo lo que tenía este log ya está en el snapshot
+            if os.path.exists(log_path + '.offsets'):
+                os.remove(log_path + '.offsets')
+            write_header(log_path, self.generation)
+        else:
+            # Una escritura cortada deja una línea sin '\n': el próximo append quedaría pegado a ella
+            truncate_partial_line(log_path)
+        self.log_offsets = OffsetIndex(log_path)
+        self.listeners = []  # Funciones (record_id, product) llamadas en cada append
+        self.pending = 0
+        self.file = open(log_path, mode='ab')
+
+    @property
+    def snapshot_count(self):
+        return len(self.snapshot_offsets)
+
+    @property
+    def log_count(self):
+        return len(self.log_offsets)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.snapshot_count + self.log_count
+
+    def __iter__(self):
+        # Primero el snapshot y después el log, en orden de inserción
+        self.file.flush()
+        for path in (self.snapshot_path, self.log_path):
+            yield from read_jsonl(path)
+
+    def append(self, product):
+        """
+        Agrega un producto al final del log.
+
+        Retorna:
+        int: El id del registro agregado
+        """
+        record_id = len(self)
+        self.log_offsets.append(self.file.tell())
+        self.file.write(json.dumps(product, ensure_ascii=False).encode('utf-8') + b'\n')
+        self.pending += 1
+        if self.pending >= self.fsync_every:
+            self.sync()
+        for listener in self.listeners:
+            listener(record_id, product)
+        if self.log_count >= max(self.compact_min, self.snapshot_count):
+            self.compact()
+        return record_id
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def get_many(self, record_ids):
+        """Lee los registros indicados saltando directo a su offset"""
+        self.file.flush()
+        products = []
+        files = {}
+        try:
+            for record_id in record_ids:
+                if record_id < self.snapshot_count:
+                    path, offset = self.snapshot_path, self.snapshot_offsets[record_id]
+                else:
+                    path, offset = self.log_path, self.log_offsets[record_id - self.snapshot_count]
+                if path not in files:
+                    files[path] = open(path, mode='rb')
+                files[path].seek(offset)
+                products.append(json.loads(files[path].readline()))
+        finally:
+            for file in files.values():
+                file.close()
+        return products
+
+    def get(self, record_id):
+        return self.get_many([record_id])[0]
+
+    def sync(self):
+        """Fuerza los registros pendientes al disco y después guarda sus offsets"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.log_offsets.flush()
+        self.pending = 0
+
+    def compact(self):
+        """Reescribe snapshot + log en un nuevo snapshot y vacía el log"""
+        self.sync()
+        generation = self.generation + 1
+        tmp_path = self.snapshot_path + '.tmp'
+        offsets = []
+        with open(tmp_path, mode='wb') as tmp:
+            tmp.write(header_line(generation))
+            for path in (self.snapshot_path, self.log_path):
+                if os.path.exists(path):
+                    with open(path, mode='rb') as source:
+                        for line in source:
+                            if line.strip() and not line.startswith(HEADER_PREFIX):
+                                offsets.append(tmp.tell())
+                                tmp.write(line)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # Los offsets viejos se borran antes de cambiar cada archivo: si el proceso se
+        # corta en el medio, al abrir se vuelven a calcular en vez de usar unos equivocados.
+        # os.replace es atómico: nunca queda un snapshot a medio escribir
+        self.snapshot_offsets.discard()
+        os.replace(tmp_path, self.snapshot_path)
+        self.generation = generation
+
+        # Los registros del log pasan al final del snapshot: sus ids no cambian
+        self.snapshot_offsets.replace(offsets)
+
+        # Si el proceso se corta antes de este reemplazo, el log viejo queda con una
+        # generación menor que la del snapshot y se descarta al abrir
+        self.file.close()
+        self.log_offsets.discard()
+        write_header(self.log_path, generation)
+        self.file = open(self.log_path, mode='ab')
+
+    def close(self):
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+
+def header_line(generation):
+    return json.dumps({HEADER_KEY: {'generation': generation}}).encode('utf-8') + b'\n'
+
+
+def read_generation(path):
+    """Generación de la cabecera del archivo (0 si no existe o no tiene cabecera)"""
+    if not os.path.exists(path):
+        return 0
+    with open(path, mode='rb') as file:
+        line = file.readline()
+    if not line.startswith(HEADER_PREFIX) or not line.endswith(b'\n'):
+        return 0
+    return json.loads(line)[HEADER_KEY]['generation']
+
+
+def write_header(path, generation):
+    """Reemplaza el archivo por uno que solo tiene la cabecera (de forma atómica)"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, mode='wb') as file:
+        file.write(header_line(generation))
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp_path, path)
+
+
+def truncate_partial_line(path, block_size=64 * 1024):
+    """
+    Corta la última línea del archivo si no termina en '\n' (escritura interrumpida).
+
+    Retorna:
+    int: Bytes descartados
+    """
+    with open(path, mode='r+b') as file:
+        size = file.seek(0, os.SEEK_END)
+        end = size
+        # Se busca el último '\n' leyendo bloques desde el final
+        while end > 0:
+            start = max(0, end - block_size)
+            file.seek(start)
+            block = file.read(end - start)
+            if end == size and block.endswith(b'\n'):
+                return 0
+            newline = block.rfind(b'\n')
+            if newline != -1:
+                end = start + newline + 1
+                break
+            end = start
+        file.truncate(end)
+        return size - end
+
+
+def scan_offsets(path, start=0):
+    """Devuelve el offset en bytes de cada registro no vacío del archivo, desde el byte start"""
+    offsets = []
+    if not os.path.exists(path):
+        return offsets
+    with open(path, mode='rb') as file:
+        file.seek(start)
+        offset = start
+        for line in file:
+            if line.strip() and not line.startswith(HEADER_PREFIX):
+                offsets.append(offset)
+            offset += len(line)
+    return offsets
+
+
+def read_jsonl(path):
+    """Lee un archivo JSON Lines registro por registro (sin la cabecera)"""
+    if not os.path.exists(path):
+        return
+    with open(path, mode='rb') as file:
+        for line in file:
+            if line.strip() and not line.startswith(HEADER_PREFIX):
+                yield json.loads(line)
+
+
+def import_products_json(store, json_path='products.json'):
+    """
+    Importa un products.json (lista de productos) al almacén.
+
+    Retorna:
+    int: Cantidad de productos importados
+    """
+    with open(json_path, mode='r', encoding='utf-8') as file:
+        products = json.load(file)
+    store.extend(products)
+    store.sync()
+    return len(products)
@@ -9,7 +9,8 @@ def callback(x):
     print(x)
 
 
-print(recursividad(100*2, callback))
+if __name__ == "__main__":
+    print(recursividad(100*2, callback))
 
 
 
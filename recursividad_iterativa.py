@@ -0,0 +1,109 @@
+import sys
+import time
+from functools import wraps
+
+from recursividad import recursividad
+
+
+def recorrer(n, callback):
+    """
+    Versión iterativa de recursividad(): llama a callback(n), callback(n-1) ... callback(0).
+
+    No crea un frame por paso, así que no tiene límite de profundidad.
+    """
+    for i in range(n, -1, -1):
+        callback(i)
+    return 0
+
+
+class _Call:
+    # Pedido de llamada recursiva que devuelve la función decorada en lugar de llamarse
+    __slots__ = ('args', 'kwargs')
+
+    def __init__(self, args, kwargs):
+        self.args = args
+        self.kwargs = kwargs
+
+
+def trampoline(func=None, *, memoize=False):
+    """
+    Decorador para funciones recursivas escritas como generadores.
+
+    Cada llamada recursiva se escribe como `resultado = yield f.call(...)` y el
+    decorador la ejecuta con una pila explícita (sin usar la pila de Python).
+    Con memoize=True los resultados se guardan por argumentos en f.cache.
+
+    Ejemplo:
+        @trampoline(memoize=True)
+        def fib(n):
+            if n < 2:
+                return n
+            return (yield fib.call(n - 1)) + (yield fib.call(n - 2))
+    """
+    if func is None:
+        return lambda f: trampoline(f, memoize=memoize)
+
+    cache = {} if memoize else None
+
+    def key_of(args, kwargs):
+        return args + tuple(sorted(kwargs.items())) if kwargs else args
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = key_of(args, kwargs)
+        if cache is not None and key in cache:
+            return cache[key]
+
+        stack = [func(*args, **kwargs)]
+        keys = [key]
+        value = None
+        while stack:
+            try:
+                request = stack[-1].send(value)
+            except StopIteration as stop:
+                value = stop.value
+                stack.pop()
+                finished = keys.pop()
+                if cache is not None:
+                    cache[finished] = value
+                continue
+
+            key = key_of(request.args, request.kwargs)
+            if cache is not None and key in cache:
+                value = cache[key]
+                continue
+            stack.append(func(*request.args, **request.kwargs))
+            keys.append(key)
+            value = None
+        return value
+
+    wrapper.call = lambda *args, **kwargs: _Call(args, kwargs)
+    wrapper.cache = cache
+    return wrapper
+
+
+@trampoline
+def recursividad_trampolin(n, callback):
+    # Misma forma que recursividad() pero la llamada recursiva es un yield
+    callback(n)
+    if n == 0:
+        return 0
+    return (yield recursividad_trampolin.call(n - 1, callback))
+
+
+if __name__ == "__main__":
+    n = 10 ** 6
+    pasos = []
+
+    print(f"Límite de recursión: {sys.getrecursionlimit()}")
+    for nombre, funcion in [('recursiva', recursividad),
+                            ('iterativa', recorrer),
+                            ('trampolín', recursividad_trampolin)]:
+        pasos.clear()
+        inicio = time.perf_counter()
+        try:
+            resultado = funcion(n, pasos.append)
+            estado = f"resultado={resultado}, {len(pasos):,} pasos"
+        except RecursionError as error:
+            estado = f"RecursionError ({error}) después de {len(pasos):,} pasos"
+        print(f"{nombre:<10} n={n:,}: {time.perf_counter() - inicio:.3f}s  {estado}")